@@ -2,19 +2,156 @@
 Scanner Orchestrator - Coordinates multiple scanner tools and aggregates results
 """
 
+import functools
+import json
 import logging
 import os
+import queue
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, List, Optional
 from pathlib import Path
 
+from scanners import ScannerError
 from scanners.prowler_scanner import ProwlerScanner
 from scanners.cloudsploit_scanner import CloudSploitScanner
 from reports.generator import ReportGenerator
 
+# Counters aggregated from every scanner result
+_SUMMARY_KEYS = ('total_checks', 'passed', 'failed', 'critical', 'high', 'medium', 'low')
+
+# Provider-specific keyword argument passed through to the scanners
+_PROVIDER_ARG = {
+    'aws': 'profile',
+    'azure': 'subscription_id',
+    'gcp': 'project_id'
+}
+
+# Providers scanned when 'all' is requested, in report order
+_PROVIDER_ORDER = tuple(_PROVIDER_ARG)
+
+# Output buffers kept for reuse, and the largest one kept; bigger outputs
+# are rare, and holding on to their buffers would pin that memory for good
+_BUF_POOL_SIZE = 4
+_BUF_MAX_BYTES = 64 * 1024 * 1024
+
+# Output directories already created by this process
+_created_dirs = set()
+
+# Scanners shared by orchestrators, keyed by (scanner class, config key)
+_scanners = {}
+
+
+class ScanSummary:
+    """Check and finding counts aggregated from scanner results"""
+
+    __slots__ = _SUMMARY_KEYS
+
+    def __init__(self, total_checks: int = 0, passed: int = 0, failed: int = 0,
+                 critical: int = 0, high: int = 0, medium: int = 0, low: int = 0):
+        self.total_checks = total_checks
+        self.passed = passed
+        self.failed = failed
+        self.critical = critical
+        self.high = high
+        self.medium = medium
+        self.low = low
+
+    @classmethod
+    def from_results(cls, results: Dict) -> 'ScanSummary':
+        """Build a summary from the counters in a scanner or provider result"""
+        return cls(**{k: results[k] for k in _SUMMARY_KEYS if k in results})
+
+    def __iadd__(self, other: 'ScanSummary') -> 'ScanSummary':
+        self.total_checks += other.total_checks
+        self.passed += other.passed
+        self.failed += other.failed
+        self.critical += other.critical
+        self.high += other.high
+        self.medium += other.medium
+        self.low += other.low
+        return self
+
+    def __isub__(self, other: 'ScanSummary') -> 'ScanSummary':
+        self.total_checks -= other.total_checks
+        self.passed -= other.passed
+        self.failed -= other.failed
+        self.critical -= other.critical
+        self.high -= other.high
+        self.medium -= other.medium
+        self.low -= other.low
+        return self
+
+    def as_dict(self) -> Dict:
+        """Return the counters as a plain dictionary for reports"""
+        return {k: getattr(self, k) for k in _SUMMARY_KEYS}
+
+
+def _config_key(config: Dict) -> Optional[str]:
+    """
+    Serialize a configuration dictionary into a hashable cache key
+
+    Returns None when JSON cannot represent the configuration, e.g. YAML
+    dates or keys of mixed types.
+    """
+    try:
+        return json.dumps(config, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_parse_pool(max_workers: int) -> Executor:
+    """Return the shared process pool used to parse scanner output"""
+    # multiprocessing is only imported when a parse pool is configured
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Spawn rather than fork: the pool is started from scanner worker threads
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'))
+
+
+def _parse_executor(config: Dict) -> Optional[Executor]:
+    """Return the parse pool if enabled in the configuration"""
+    workers = config['scanners'].get('parse_workers', 0)
+    return _get_parse_pool(workers) if workers else None
+
+
+def _get_scanner(scanner_cls, config: Dict):
+    """
+    Return a scanner for the given configuration, shared when it has a key
+
+    The scanner is always built from the configuration itself; the key only
+    decides which orchestrators share it. Configurations without a key get
+    a scanner of their own.
+
+    Args:
+        scanner_cls: ProwlerScanner or CloudSploitScanner
+        config: Configuration dictionary
+
+    Returns:
+        Scanner instance
+    """
+    config_key = _config_key(config)
+    if config_key is None:
+        return scanner_cls(config, parse_executor=_parse_executor(config))
+
+    key = (scanner_cls, config_key)
+    scanner = _scanners.get(key)
+    if scanner is None:
+        scanner = _scanners.setdefault(key, scanner_cls(config, parse_executor=_parse_executor(config)))
+    return scanner
+
 
 class ScannerOrchestrator:
-    """Orchestrates security scans across multiple cloud providers"""
+    """
+    Orchestrates security scans across multiple cloud providers
+
+    Providers and scanners run on worker threads that only return their
+    results. self.results, and the running totals behind get_summary(), are
+    only mutated from the thread that called scan(), so no lock is needed.
+    """
 
     def __init__(self, config: Dict):
         """
@@ -25,11 +162,38 @@ class ScannerOrchestrator:
         """
         self.config = config
         self.logger = logging.getLogger(__name__)
+
+        # Only mutated from the thread that called scan(); workers never touch it
         self.results = {}
 
-        # Initialize scanners
-        self.prowler = ProwlerScanner(config) if config['scanners']['prowler']['enabled'] else None
-        self.cloudsploit = CloudSploitScanner(config) if config['scanners']['cloudsploit']['enabled'] else None
+        # Serialized report section of each provider in self.results; the
+        # findings are only kept here, so later reports reuse these
+        self._sections = {}
+
+        # Running totals across self.results, kept current by scan()
+        self._overall = ScanSummary()
+        self._providers_scanned = []
+
+        # Reusable buffers for reading scanner output, shared by worker threads
+        self._buf_pool = queue.LifoQueue(maxsize=_BUF_POOL_SIZE)
+
+        # Initialize scanners (reused across orchestrators with the same configuration)
+        self.prowler = (_get_scanner(ProwlerScanner, config)
+                        if config['scanners']['prowler']['enabled'] else None)
+        self.cloudsploit = (_get_scanner(CloudSploitScanner, config)
+                            if config['scanners']['cloudsploit']['enabled'] else None)
+
+        # Resolve the scan plan once instead of re-reading the config per provider
+        self._enabled_providers = frozenset(
+            provider for provider, provider_config in config['providers'].items()
+            if provider_config['enabled']
+        )
+        self._active_scanners = tuple(
+            (key, name, scanner) for key, name, scanner in (
+                ('prowler', 'Prowler', self.prowler),
+                ('cloudsploit', 'CloudSploit', self.cloudsploit)
+            ) if scanner
+        )
 
         # Initialize report generator
         self.report_generator = ReportGenerator(config)
@@ -37,20 +201,61 @@ class ScannerOrchestrator:
         # Create output directories
         self._setup_directories()
 
+    @classmethod
+    def clear_caches(cls):
+        """Drop cached scanner instances (e.g. between test cases)"""
+        _scanners.clear()
+
+    def acquire_buf(self) -> bytearray:
+        """
+        Borrow an output buffer from the pool
+
+        Returns:
+            A pooled buffer, or a new one if the pool is empty
+        """
+        try:
+            return self._buf_pool.get_nowait()
+        except queue.Empty:
+            return bytearray()
+
+    def release_buf(self, buf: bytearray):
+        """
+        Return a borrowed output buffer to the pool
+
+        Buffers over _BUF_MAX_BYTES, or beyond _BUF_POOL_SIZE pooled ones,
+        are dropped rather than kept.
+
+        Args:
+            buf: Buffer obtained from acquire_buf
+        """
+        if len(buf) > _BUF_MAX_BYTES:
+            return
+        try:
+            self._buf_pool.put_nowait(buf)
+        except queue.Full:
+            pass
+
     def _setup_directories(self):
         """Create necessary output directories"""
-        directories = [
+        directories = {
             self.config['output']['reports_dir'],
             'logs'
-        ]
+        }
 
         if self.prowler:
-            directories.append(self.config['scanners']['prowler']['output_dir'])
+            directories.add(self.config['scanners']['prowler']['output_dir'])
         if self.cloudsploit:
-            directories.append(self.config['scanners']['cloudsploit']['output_dir'])
+            directories.add(self.config['scanners']['cloudsploit']['output_dir'])
 
-        for directory in directories:
-            Path(directory).mkdir(parents=True, exist_ok=True)
+        pending = sorted(directories - _created_dirs, key=lambda d: len(Path(d).parts))
+        if not pending:
+            return
+
+        # Overlap the stat/mkdir round trips, which are slow on network mounts
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            list(pool.map(lambda d: os.makedirs(d, exist_ok=True), pending))
+
+        _created_dirs.update(pending)
 
     def scan(self, providers: List[str], project_id: Optional[str] = None,
              subscription_id: Optional[str] = None, profile: Optional[str] = None) -> Dict:
@@ -64,28 +269,78 @@ class ScannerOrchestrator:
             profile: AWS profile name (optional)
 
         Returns:
-            Dictionary containing scan results
+            Dictionary containing scan results. Scanner results hold a
+            'findings_count' in place of their findings, which are only
+            written to the report.
         """
-        if 'all' in providers:
-            providers = ['aws', 'azure', 'gcp']
-
-        self.logger.info(f"Starting security scan for providers: {', '.join(providers)}")
-        scan_start = datetime.now()
-
-        for provider in providers:
-            if not self.config['providers'][provider]['enabled']:
-                self.logger.warning(f"{provider.upper()} is disabled in configuration, skipping")
-                continue
-
-            self.logger.info(f"Scanning {provider.upper()}...")
-            self.results[provider] = self._scan_provider(provider, project_id, subscription_id, profile)
-
-        scan_duration = (datetime.now() - scan_start).total_seconds()
-        self.logger.info(f"Scan completed in {scan_duration:.2f} seconds")
+        # Resolve the request once: expand 'all', drop duplicates, and split
+        # off providers disabled in the configuration
+        requested = _PROVIDER_ORDER if 'all' in providers else tuple(dict.fromkeys(providers))
+        enabled = [p for p in requested if p in self._enabled_providers]
+        disabled = [p.upper() for p in requested if p not in self._enabled_providers]
+
+        self.logger.info("Starting security scan for providers: %s", ', '.join(requested))
+        if disabled:
+            self.logger.warning("Disabled in configuration, skipping: %s", ', '.join(disabled))
+
+        # Local time with its UTC offset, so the report and every scanner
+        # output file of this run share one timestamp
+        scan_start = datetime.now().astimezone()
+        start_ns = time.perf_counter_ns()
+        scan_id = scan_start.strftime(self.config['output']['timestamp_format'])
+
+        # Scans are subprocess/network bound, so run providers concurrently.
+        # Workers return their results; self.results is only written here.
+        # Each finished provider is serialized for the report on a separate
+        # single-worker pool while the remaining scans are still running.
+        sections = {}
+        if enabled:
+            with ThreadPoolExecutor(max_workers=len(enabled)) as pool, \
+                    ThreadPoolExecutor(max_workers=1) as report_pool:
+                futures = {}
+                for provider in enabled:
+                    self.logger.info("Scanning %s...", provider.upper())
+                    future = pool.submit(self._scan_provider, provider, project_id,
+                                         subscription_id, profile, scan_id)
+                    futures[future] = provider
+
+                provider_results = {}
+                section_futures = {}
+                for future in as_completed(futures):
+                    provider = futures[future]
+                    provider_results[provider] = future.result()
+                    section_futures[provider] = report_pool.submit(
+                        self.report_generator.render_provider, provider, provider_results[provider]
+                    )
+
+                sections = {provider: f.result() for provider, f in section_futures.items()}
+
+            # Findings now live in the serialized report sections only
+            for results in provider_results.values():
+                self._release_findings(results)
+            self._sections.update(sections)
+
+            # Keep report ordering stable regardless of completion order
+            for provider in enabled:
+                previous = self.results.get(provider)
+                if previous is None:
+                    self._providers_scanned.append(provider)
+                else:
+                    self._overall -= ScanSummary.from_results(previous['summary'])
+                self.results[provider] = provider_results[provider]
+                self._overall += ScanSummary.from_results(provider_results[provider]['summary'])
+
+        scan_duration = (time.perf_counter_ns() - start_ns) / 1e9
+        self.logger.info("Scan completed in %.2f seconds", scan_duration)
 
         # Generate consolidated report
-        report_path = self.report_generator.generate(self.results)
-        self.logger.info(f"Reports generated at: {report_path}")
+        report_path = self.report_generator.generate(
+            self.results,
+            timestamp=scan_start.isoformat(),
+            scan_duration=scan_duration,
+            sections=self._sections
+        )
+        self.logger.info("Reports generated at: %s", report_path)
 
         return {
             'results': self.results,
@@ -95,7 +350,8 @@ class ScannerOrchestrator:
         }
 
     def _scan_provider(self, provider: str, project_id: Optional[str] = None,
-                      subscription_id: Optional[str] = None, profile: Optional[str] = None) -> Dict:
+                      subscription_id: Optional[str] = None, profile: Optional[str] = None,
+                      scan_id: Optional[str] = None) -> Dict:
         """
         Scan a specific cloud provider
 
@@ -104,6 +360,7 @@ class ScannerOrchestrator:
             project_id: GCP project ID (optional)
             subscription_id: Azure subscription ID (optional)
             profile: AWS profile name (optional)
+            scan_id: Timestamp shared by the run's output files (optional)
 
         Returns:
             Dictionary containing scan results for the provider
@@ -112,66 +369,85 @@ class ScannerOrchestrator:
             'provider': provider,
             'prowler': None,
             'cloudsploit': None,
-            'summary': {
-                'failed': 0,
-                'critical': 0,
-                'high': 0,
-                'medium': 0,
-                'low': 0
-            }
+            'summary': None
         }
+        summary = ScanSummary()
 
-        # Prepare scanner kwargs based on provider
-        scan_kwargs = {}
-        if provider == 'gcp' and project_id:
-            scan_kwargs['project_id'] = project_id
-        elif provider == 'azure' and subscription_id:
-            scan_kwargs['subscription_id'] = subscription_id
-        elif provider == 'aws' and profile:
-            scan_kwargs['profile'] = profile
-
-        # Run Prowler scan
-        if self.prowler:
-            try:
-                self.logger.info(f"Running Prowler scan for {provider.upper()}...")
-                prowler_results = self.prowler.scan(provider, **scan_kwargs)
-                provider_results['prowler'] = prowler_results
-                self._update_summary(provider_results['summary'], prowler_results)
-            except Exception as e:
-                self.logger.error(f"Prowler scan failed for {provider}: {str(e)}")
-                provider_results['prowler'] = {'error': str(e)}
-
-        # Run CloudSploit scan
-        if self.cloudsploit:
-            try:
-                self.logger.info(f"Running CloudSploit scan for {provider.upper()}...")
-                cloudsploit_results = self.cloudsploit.scan(provider, **scan_kwargs)
-                provider_results['cloudsploit'] = cloudsploit_results
-                self._update_summary(provider_results['summary'], cloudsploit_results)
-            except Exception as e:
-                self.logger.error(f"CloudSploit scan failed for {provider}: {str(e)}")
-                provider_results['cloudsploit'] = {'error': str(e)}
+        provider_up = provider.upper()
 
+        # Prepare scanner kwargs based on provider
+        arg_values = {'profile': profile, 'subscription_id': subscription_id, 'project_id': project_id}
+        arg_name = _PROVIDER_ARG[provider]
+        scan_kwargs = {arg_name: arg_values[arg_name]} if arg_values[arg_name] else {}
+        if scan_id:
+            scan_kwargs['scan_id'] = scan_id
+
+        # Run the active scanners concurrently for this provider
+        if self._active_scanners:
+            with ThreadPoolExecutor(max_workers=len(self._active_scanners)) as pool:
+                futures = {}
+                for key, name, scanner in self._active_scanners:
+                    self.logger.info("Running %s scan for %s...", name, provider_up)
+                    futures[pool.submit(self._run_scanner, scanner, provider, scan_kwargs)] = (key, name)
+
+                for future in as_completed(futures):
+                    key, name = futures[future]
+                    try:
+                        scanner_results = future.result()
+                        provider_results[key] = scanner_results
+                        self._update_summary(summary, scanner_results)
+                    except ScannerError as e:
+                        self.logger.error("%s scan failed for %s: %s", name, provider, e)
+                        provider_results[key] = {'error': str(e)}
+                    except Exception as e:
+                        self.logger.exception("%s scan failed for %s: %s", name, provider, e)
+                        provider_results[key] = {'error': str(e)}
+
+        provider_results['summary'] = summary.as_dict()
         return provider_results
 
-    def _update_summary(self, summary: Dict, results: Dict):
+    def _run_scanner(self, scanner, provider: str, scan_kwargs: Dict) -> Dict:
+        """
+        Run a single scanner with a pooled output buffer
+
+        Args:
+            scanner: Scanner instance
+            provider: Cloud provider name
+            scan_kwargs: Provider-specific scanner arguments
+
+        Returns:
+            Scanner results dictionary
+        """
+        buf = self.acquire_buf()
+        try:
+            return scanner.scan(provider, out_buf=buf, **scan_kwargs)
+        finally:
+            self.release_buf(buf)
+
+    def _release_findings(self, provider_results: Dict):
+        """
+        Replace scanner finding lists with their counts once serialized
+
+        Args:
+            provider_results: Results dictionary for a single provider
+        """
+        for key, _, _ in self._active_scanners:
+            scanner_results = provider_results.get(key)
+            if scanner_results and 'findings' in scanner_results:
+                scanner_results['findings_count'] = len(scanner_results.pop('findings'))
+
+    def _update_summary(self, summary: ScanSummary, results: Dict):
         """
         Update summary statistics with scan results
 
         Args:
-            summary: Summary dictionary to update
+            summary: Summary to update
             results: Scan results to aggregate
         """
         if 'error' in results:
             return
 
-        # Add logic to aggregate results based on scanner output format
-        if 'failed' in results:
-            summary['failed'] += results.get('failed', 0)
-            summary['critical'] += results.get('critical', 0)
-            summary['high'] += results.get('high', 0)
-            summary['medium'] += results.get('medium', 0)
-            summary['low'] += results.get('low', 0)
+        summary += ScanSummary.from_results(results)
 
     def get_summary(self) -> Dict:
         """
@@ -180,22 +456,6 @@ class ScannerOrchestrator:
         Returns:
             Dictionary containing summary of all scans
         """
-        overall_summary = {
-            'failed': 0,
-            'critical': 0,
-            'high': 0,
-            'medium': 0,
-            'low': 0,
-            'providers_scanned': []
-        }
-
-        for provider, results in self.results.items():
-            overall_summary['providers_scanned'].append(provider)
-            summary = results.get('summary', {})
-            overall_summary['failed'] += summary.get('failed', 0)
-            overall_summary['critical'] += summary.get('critical', 0)
-            overall_summary['high'] += summary.get('high', 0)
-            overall_summary['medium'] += summary.get('medium', 0)
-            overall_summary['low'] += summary.get('low', 0)
-
+        overall_summary = self._overall.as_dict()
+        overall_summary['providers_scanned'] = list(self._providers_scanned)
         return overall_summary
@@ -0,0 +1 @@
+# Reports module initialization
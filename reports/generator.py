@@ -0,0 +1,94 @@
+"""
+Report Generator
+Writes consolidated scan reports in the configured output formats
+"""
+
+import io
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+from html_report_maker.report_generator import get_generator
+
+
+class ReportGenerator:
+    """Generates consolidated reports from orchestrator scan results"""
+
+    def __init__(self, config: Dict):
+        """
+        Initialize the report generator
+
+        Args:
+            config: Configuration dictionary
+        """
+        self.config = config
+        self.logger = logging.getLogger(__name__)
+        self.reports_dir = Path(config['output']['reports_dir'])
+        self.formats = config['output'].get('format', ['json'])
+
+    def render_provider(self, provider: str, results: Dict) -> bytes:
+        """
+        Serialize a single provider's results as a JSON object member
+
+        Called as soon as a provider finishes so serialization overlaps
+        with the scans still in flight.
+
+        Args:
+            provider: Cloud provider name
+            results: Scan results for the provider
+
+        Returns:
+            Encoded '"provider": {...}' fragment
+        """
+        return f"{json.dumps(provider)}: {json.dumps(results, indent=2, default=str)}".encode('utf-8')
+
+    def generate(self, results: Dict, timestamp: Optional[str] = None,
+                 scan_duration: Optional[float] = None,
+                 sections: Optional[Dict[str, bytes]] = None) -> str:
+        """
+        Generate consolidated reports
+
+        Args:
+            results: Scan results keyed by provider
+            timestamp: ISO timestamp of the scan start (optional)
+            scan_duration: Scan duration in seconds (optional)
+            sections: Pre-rendered provider fragments from render_provider (optional)
+
+        Returns:
+            Path to the reports directory
+        """
+        timestamp = timestamp or datetime.now().isoformat()
+        sections = sections or {}
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
+
+        file_stamp = datetime.fromisoformat(timestamp).strftime(self.config['output']['timestamp_format'])
+        json_file = self.reports_dir / f"scan_report_{file_stamp}.json"
+
+        # Assemble the whole document in memory and hand it to the OS in one write
+        buffer = io.BytesIO()
+        buffer.write(b'{\n"timestamp": ')
+        buffer.write(json.dumps(timestamp).encode('utf-8'))
+        buffer.write(b',\n"scan_duration": ')
+        buffer.write(json.dumps(scan_duration or 0).encode('utf-8'))
+        buffer.write(b',\n"results": {')
+        for index, provider in enumerate(results):
+            if index:
+                buffer.write(b',')
+            buffer.write(b'\n')
+            buffer.write(sections.get(provider) or self.render_provider(provider, results[provider]))
+        buffer.write(b'\n}\n}\n')
+
+        with open(json_file, 'wb') as f:
+            f.write(buffer.getbuffer())
+
+        self.logger.info("JSON report written to %s", json_file)
+
+        if 'html' in self.formats:
+            try:
+                get_generator().generate_report(str(json_file))
+            except Exception as e:
+                self.logger.error("Failed to generate HTML report: %s", e)
+
+        return str(self.reports_dir)
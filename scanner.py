@@ -5,57 +5,63 @@ Runtime security scanning using Prowler, CloudSploit, and Steampipe
 """
 
 import click
-import logging
 import sys
-import yaml
 import os
-from pathlib import Path
-from datetime import datetime
 
 # Fix Windows Unicode encoding issues
 if sys.platform == 'win32':
     os.environ['PYTHONIOENCODING'] = 'utf-8'
 
-from core.orchestrator import ScannerOrchestrator
-from utils.logger import setup_logging
-from utils.config_loader import load_config
+# The scanner, reporting and config modules are imported inside main() so
+# --help and the interactive prompts do not pay for loading them
+
+# Providers scanned by 'all', in menu order
+_PROVIDERS = ('aws', 'azure', 'gcp')
+
+# Interactive menu number for each provider
+_PROVIDER_MENU = dict(enumerate(_PROVIDERS, start=1))
 
 
 def interactive_mode():
     """Interactive mode with step-by-step prompts"""
-    click.echo("=" * 70)
-    click.echo("Cloud Security Scanner - Interactive Mode")
-    click.echo("=" * 70)
-    click.echo()
+    click.echo("\n".join([
+        "=" * 70,
+        "Cloud Security Scanner - Interactive Mode",
+        "=" * 70,
+        ""
+    ]))
 
     # Step 1: Select cloud provider
-    click.echo("STEP 1: Select Cloud Provider")
-    click.echo("-" * 70)
-    click.echo("Which cloud provider do you want to scan?")
-    click.echo("  1. AWS (Amazon Web Services)")
-    click.echo("  2. Azure (Microsoft Azure)")
-    click.echo("  3. GCP (Google Cloud Platform)")
-    click.echo()
+    click.echo("\n".join([
+        "STEP 1: Select Cloud Provider",
+        "-" * 70,
+        "Which cloud provider do you want to scan?",
+        "  1. AWS (Amazon Web Services)",
+        "  2. Azure (Microsoft Azure)",
+        "  3. GCP (Google Cloud Platform)",
+        ""
+    ]))
 
     provider_choice = click.prompt("Enter your choice (1-3)", type=int, default=1)
-    provider_map = {1: 'aws', 2: 'azure', 3: 'gcp'}
-    provider = provider_map.get(provider_choice, 'aws')
+    provider = _PROVIDER_MENU.get(provider_choice, 'aws')
 
     click.echo(f"\n✓ Selected: {provider.upper()}\n")
 
     # Step 2: Select scanning tools
-    click.echo("STEP 2: Select Scanning Tools")
-    click.echo("-" * 70)
-    click.echo("Which tools do you want to use?")
-    click.echo("  1. Prowler only (Python-based, 800+ checks)")
-    click.echo("  2. CloudSploit only (Node.js-based, 1000+ checks)")
-    click.echo("  3. Prowler + CloudSploit (Recommended - Maximum coverage)")
-    click.echo()
+    click.echo("\n".join([
+        "STEP 2: Select Scanning Tools",
+        "-" * 70,
+        "Which tools do you want to use?",
+        "  1. Prowler only (Python-based, 800+ checks)",
+        "  2. CloudSploit only (Node.js-based, 1000+ checks)",
+        "  3. Prowler + CloudSploit (Recommended - Maximum coverage)",
+        ""
+    ]))
 
     tool_choice = click.prompt("Enter your choice (1-3)", type=int, default=3)
 
-    use_prowler = tool_choice in [1, 3]
-    use_cloudsploit = tool_choice in [2, 3]
+    use_prowler = tool_choice in (1, 3)
+    use_cloudsploit = tool_choice in (2, 3)
     use_steampipe = False
 
     tools = []
@@ -69,7 +75,7 @@ def interactive_mode():
     click.echo(f"\n✓ Selected tools: {', '.join(tools)}\n")
 
     # Step 3: Configure credentials
-    providers = [provider] if provider != 'all' else ['aws', 'azure', 'gcp']
+    providers = [provider] if provider != 'all' else list(_PROVIDERS)
     credentials_config = {}
 
     for prov in providers:
@@ -81,11 +87,13 @@ def interactive_mode():
             credentials_config['gcp'] = configure_gcp_credentials()
 
     # Step 4: Confirm and run
-    click.echo("\nSTEP 4: Confirm Configuration")
-    click.echo("-" * 70)
-    click.echo(f"Cloud Provider(s): {', '.join([p.upper() for p in providers])}")
-    click.echo(f"Scanning Tools:    {', '.join(tools)}")
-    click.echo("-" * 70)
+    click.echo("\n".join([
+        "\nSTEP 4: Confirm Configuration",
+        "-" * 70,
+        f"Cloud Provider(s): {', '.join([p.upper() for p in providers])}",
+        f"Scanning Tools:    {', '.join(tools)}",
+        "-" * 70
+    ]))
 
     if click.confirm("\nProceed with scan?", default=True):
         return provider, use_prowler, use_cloudsploit, use_steampipe, credentials_config, True
@@ -96,14 +104,16 @@ def interactive_mode():
 
 def configure_aws_credentials():
     """Configure AWS credentials interactively"""
-    click.echo("\nSTEP 3a: Configure AWS Credentials")
-    click.echo("-" * 70)
-    click.echo("How do you want to provide AWS credentials?")
-    click.echo("  1. Use existing AWS profile from ~/.aws/credentials")
-    click.echo("  2. Use environment variables (already set)")
-    click.echo("  3. Enter credentials manually (will set as environment variables)")
-    click.echo("  4. Skip (use default credentials)")
-    click.echo()
+    click.echo("\n".join([
+        "\nSTEP 3a: Configure AWS Credentials",
+        "-" * 70,
+        "How do you want to provide AWS credentials?",
+        "  1. Use existing AWS profile from ~/.aws/credentials",
+        "  2. Use environment variables (already set)",
+        "  3. Enter credentials manually (will set as environment variables)",
+        "  4. Skip (use default credentials)",
+        ""
+    ]))
 
     cred_choice = click.prompt("Enter your choice (1-4)", type=int, default=1)
 
@@ -123,9 +133,11 @@ def configure_aws_credentials():
         region = click.prompt("AWS Region", default="us-east-1")
 
         # Set environment variables
-        os.environ['AWS_ACCESS_KEY_ID'] = access_key
-        os.environ['AWS_SECRET_ACCESS_KEY'] = secret_key
-        os.environ['AWS_DEFAULT_REGION'] = region
+        os.environ.update({
+            'AWS_ACCESS_KEY_ID': access_key,
+            'AWS_SECRET_ACCESS_KEY': secret_key,
+            'AWS_DEFAULT_REGION': region
+        })
 
         click.echo("✓ Credentials set as environment variables")
         return {'type': 'manual', 'region': region}
@@ -137,14 +149,16 @@ def configure_aws_credentials():
 
 def configure_azure_credentials():
     """Configure Azure credentials interactively"""
-    click.echo("\nSTEP 3b: Configure Azure Credentials")
-    click.echo("-" * 70)
-    click.echo("How do you want to authenticate with Azure?")
-    click.echo("  1. Use Azure CLI (az login) - Recommended")
-    click.echo("  2. Use environment variables (already set)")
-    click.echo("  3. Enter Service Principal credentials manually")
-    click.echo("  4. Skip (use default credentials)")
-    click.echo()
+    click.echo("\n".join([
+        "\nSTEP 3b: Configure Azure Credentials",
+        "-" * 70,
+        "How do you want to authenticate with Azure?",
+        "  1. Use Azure CLI (az login) - Recommended",
+        "  2. Use environment variables (already set)",
+        "  3. Enter Service Principal credentials manually",
+        "  4. Skip (use default credentials)",
+        ""
+    ]))
 
     cred_choice = click.prompt("Enter your choice (1-4)", type=int, default=1)
 
@@ -165,10 +179,12 @@ def configure_azure_credentials():
         subscription_id = click.prompt("Subscription ID")
 
         # Set environment variables
-        os.environ['AZURE_TENANT_ID'] = tenant_id
-        os.environ['AZURE_CLIENT_ID'] = client_id
-        os.environ['AZURE_CLIENT_SECRET'] = client_secret
-        os.environ['AZURE_SUBSCRIPTION_ID'] = subscription_id
+        os.environ.update({
+            'AZURE_TENANT_ID': tenant_id,
+            'AZURE_CLIENT_ID': client_id,
+            'AZURE_CLIENT_SECRET': client_secret,
+            'AZURE_SUBSCRIPTION_ID': subscription_id
+        })
 
         click.echo("✓ Credentials set as environment variables")
         return {'type': 'manual', 'subscription_id': subscription_id}
@@ -180,12 +196,14 @@ def configure_azure_credentials():
 
 def configure_gcp_credentials():
     """Configure GCP credentials interactively"""
-    click.echo("\nSTEP 3c: Configure GCP Credentials")
-    click.echo("-" * 70)
-    click.echo("How do you want to authenticate with GCP?")
-    click.echo("  1. Use service account key file")
-    click.echo("  2. Use environment variables (already set)")
-    click.echo()
+    click.echo("\n".join([
+        "\nSTEP 3c: Configure GCP Credentials",
+        "-" * 70,
+        "How do you want to authenticate with GCP?",
+        "  1. Use service account key file",
+        "  2. Use environment variables (already set)",
+        ""
+    ]))
 
     cred_choice = click.prompt("Enter your choice (1-2)", type=int, default=1)
 
@@ -214,7 +232,7 @@ def configure_gcp_credentials():
 @click.option(
     '--provider',
     '-p',
-    type=click.Choice(['aws', 'azure', 'gcp', 'all'], case_sensitive=False),
+    type=click.Choice([*_PROVIDERS, 'all'], case_sensitive=False),
     help='Cloud provider to scan'
 )
 @click.option(
@@ -275,6 +293,10 @@ def main(interactive, provider, config, profile, project_id, subscription_id, ve
         if credentials_config and 'aws' in credentials_config:
             profile = credentials_config['aws'].get('profile', profile)
 
+    import logging
+    from utils.config_loader import load_config
+    from utils.logger import setup_logging
+
     # Load configuration
     try:
         config_data = load_config(config)
@@ -297,20 +319,24 @@ def main(interactive, provider, config, profile, project_id, subscription_id, ve
     logger = logging.getLogger(__name__)
 
     # Display banner
-    click.echo()
-    click.echo("=" * 70)
-    click.echo("Cloud Security Scanner - Runtime Scanning (Approach 2)")
-    click.echo("=" * 70)
-    click.echo(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    click.echo(f"Provider(s): {provider.upper()}")
-    click.echo("=" * 70)
-    click.echo()
+    from datetime import datetime
+    click.echo("\n".join([
+        "",
+        "=" * 70,
+        "Cloud Security Scanner - Runtime Scanning (Approach 2)",
+        "=" * 70,
+        f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"Provider(s): {provider.upper()}",
+        "=" * 70,
+        ""
+    ]))
 
     # Determine providers to scan
-    providers = [provider.lower()] if provider != 'all' else ['aws', 'azure', 'gcp']
+    providers = [provider.lower()] if provider != 'all' else list(_PROVIDERS)
 
     try:
         # Initialize orchestrator
+        from core.orchestrator import ScannerOrchestrator
         orchestrator = ScannerOrchestrator(config_data)
 
         # Execute scans
@@ -318,30 +344,32 @@ def main(interactive, provider, config, profile, project_id, subscription_id, ve
         results = orchestrator.scan(providers, project_id=project_id,
                                    subscription_id=subscription_id, profile=profile)
 
-        # Display summary
-        click.echo()
-        click.echo("=" * 70)
-        click.echo("SCAN SUMMARY")
-        click.echo("=" * 70)
-
+        # Display summary as one write
         summary = orchestrator.get_summary()
-        click.echo(f"Providers scanned: {', '.join(summary['providers_scanned'])}")
-        click.echo(f"Failed checks:     {summary['failed']}")
-        click.echo()
-        click.echo("By Severity:")
-        click.echo(f"  Critical:        {summary['critical']}")
-        click.echo(f"  High:            {summary['high']}")
-        click.echo(f"  Medium:          {summary['medium']}")
-        click.echo(f"  Low:             {summary['low']}")
-        click.echo()
-        click.echo(f"Reports saved to:  {results['report_path']}")
-        click.echo(f"Scan duration:     {results['scan_duration']:.2f} seconds")
-        click.echo("=" * 70)
+        click.echo("\n".join([
+            "",
+            "=" * 70,
+            "SCAN SUMMARY",
+            "=" * 70,
+            f"Providers scanned: {', '.join(summary['providers_scanned'])}",
+            f"Total checks:      {summary['total_checks']}",
+            f"Passed checks:     {summary['passed']}",
+            f"Failed checks:     {summary['failed']}",
+            "",
+            "By Severity:",
+            f"  Critical:        {summary['critical']}",
+            f"  High:            {summary['high']}",
+            f"  Medium:          {summary['medium']}",
+            f"  Low:             {summary['low']}",
+            "",
+            f"Reports saved to:  {results['report_path']}",
+            f"Scan duration:     {results['scan_duration']:.2f} seconds",
+            "=" * 70
+        ]))
 
         # Exit with appropriate code
         if summary['critical'] > 0 or summary['high'] > 0:
-            click.echo()
-            click.echo("WARNING: Critical or High severity issues found!")
+            click.echo("\nWARNING: Critical or High severity issues found!")
             sys.exit(1)
         else:
             sys.exit(0)
@@ -1 +1,156 @@
 # Scanners module initialization
+
+import collections
+import hashlib
+import json
+import os
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional, Tuple
+
+# Lines of scanner stderr kept for the messages logged on failure
+_STDERR_TAIL_LINES = 200
+
+# Environment variables identifying the cloud principal a scan runs as;
+# part of every ResultCache key so cached results never cross accounts
+_IDENTITY_ENV = (
+    'AWS_PROFILE', 'AWS_ACCESS_KEY_ID',
+    'AZURE_TENANT_ID', 'AZURE_CLIENT_ID', 'AZURE_SUBSCRIPTION_ID',
+    'GOOGLE_APPLICATION_CREDENTIALS', 'GOOGLE_CLOUD_PROJECT'
+)
+
+
+class ScannerError(ValueError):
+    """Raised when a scanner cannot run the requested scan"""
+
+
+def wait_for_scan(process: subprocess.Popen, timeout: float) -> Tuple[int, bytes]:
+    """
+    Wait for a scanner process while draining its stderr
+
+    stderr is drained on a helper thread so a chatty process cannot
+    block on a full pipe, and so the timeout still applies. Only the last
+    lines are kept.
+
+    Args:
+        process: Running scanner process with stderr piped in binary mode
+        timeout: Seconds to wait before killing the process
+
+    Returns:
+        Tuple of (exit code, last lines of stderr, undecoded)
+
+    Raises:
+        subprocess.TimeoutExpired: If the scan exceeds the timeout (the process is killed)
+    """
+    stderr_tail = collections.deque(maxlen=_STDERR_TAIL_LINES)
+    reader = threading.Thread(target=stderr_tail.extend, args=(process.stderr,), daemon=True)
+    reader.start()
+
+    try:
+        returncode = process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        reader.join(timeout=5)
+        process.stderr.close()
+
+    return returncode, b''.join(stderr_tail)
+
+
+def read_into(f: BinaryIO, out_buf: bytearray) -> bytearray:
+    """
+    Read an open binary file into a reusable buffer
+
+    Args:
+        f: File opened in binary mode, positioned at its start
+        out_buf: Pooled buffer to read the file into
+
+    Returns:
+        out_buf, resized in place to hold exactly the file content
+    """
+    size = os.fstat(f.fileno()).st_size
+    if len(out_buf) < size:
+        # Grow in place; any excess is trimmed after the read
+        out_buf[len(out_buf):] = bytes(size - len(out_buf))
+    read = f.readinto(out_buf)
+    del out_buf[read:]
+    return out_buf
+
+
+class ResultCache:
+    """
+    On-disk cache of scan results, reused for identical scans within a TTL
+
+    Entries are JSON files named by a hash of the scan parameters and the
+    cloud identity in the environment; an entry's age is its file's mtime.
+    """
+
+    def __init__(self, cache_dir: Path, ttl: float):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+
+    def key(self, *parts) -> str:
+        """
+        Build the cache key of a scan
+
+        Args:
+            *parts: JSON-serializable values that determine the scan's results
+
+        Returns:
+            Hex digest identifying the scan
+        """
+        identity = [os.environ.get(name) for name in _IDENTITY_ENV]
+        payload = json.dumps([parts, identity], sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Load the results cached under a key if they are still fresh
+
+        Args:
+            key: Key from ResultCache.key
+
+        Returns:
+            Cached results dictionary, or None if missing, expired or unreadable
+        """
+        path = self.cache_dir / f"{key}.json"
+        try:
+            with open(path, 'rb') as f:
+                if time.time() - os.fstat(f.fileno()).st_mtime >= self.ttl:
+                    return None
+                return json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, results: Dict):
+        """
+        Cache scan results under a key; error results are not cached
+
+        The entry is written to a temporary file and renamed into place, so
+        a concurrent reader never sees a partial file. Failing to write the
+        cache is not an error.
+
+        Args:
+            key: Key from ResultCache.key
+            results: Scan results dictionary
+        """
+        if 'error' in results:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            payload = json.dumps(results).encode('utf-8')
+            fd, tmp_path = tempfile.mkstemp(dir=str(self.cache_dir), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_path, self.cache_dir / f"{key}.json")
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            pass
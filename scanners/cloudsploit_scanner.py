@@ -3,66 +3,379 @@ CloudSploit Scanner Integration
 Provides 700+ cloud security checks across AWS, Azure, GCP, and Oracle Cloud
 """
 
+import atexit
+import contextlib
+import functools
 import json
 import logging
 import os
+import shutil
 import subprocess
 import tempfile
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from concurrent.futures import Executor
+from typing import BinaryIO, Dict, List, Optional
+
+from scanners import ResultCache, ScannerError, read_into, wait_for_scan
+
+# Prefer orjson for parsing scan output when it is installed
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+    def _dumps(obj) -> bytes:
+        """Serialize to compact JSON bytes, like orjson.dumps"""
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# ijson lets very large output files be parsed incrementally
+try:
+    import ijson as _ijson
+except ImportError:
+    _ijson = None
+
+# Severities CloudSploit may report explicitly
+_SEVERITIES = frozenset(('critical', 'high', 'medium', 'low'))
+
+# Common spellings of those severities, mapped to one shared string each
+_SEVERITY_NAMES = {variant: name for name in _SEVERITIES
+                   for variant in (name, name.title(), name.upper())}
+
+# Keywords used to infer a severity when CloudSploit does not report one,
+# checked in this order
+_SEVERITY_KEYWORDS = (
+    ('critical', ('exposed', 'public', 'encryption disabled', 'mfa disabled', 'no encryption', 'open to world')),
+    ('high', ('vulnerable', 'insecure', 'weak', 'misconfigured', 'missing encryption', 'unencrypted')),
+    ('low', ('logging', 'monitoring', 'tag', 'label'))
+)
+
+
+def _build_severity_automaton():
+    """
+    Build an Aho-Corasick automaton over the severity keywords
+
+    Matches every keyword in a single pass over the text. Each keyword maps
+    to the index of its tier in _SEVERITY_KEYWORDS.
+
+    Returns:
+        ahocorasick.Automaton, or None if pyahocorasick is not installed
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    # Add the lowest tiers first so a keyword listed twice keeps its higher tier
+    for rank in reversed(range(len(_SEVERITY_KEYWORDS))):
+        for keyword in _SEVERITY_KEYWORDS[rank][1]:
+            automaton.add_word(keyword, rank)
+    automaton.make_automaton()
+    return automaton
+
+
+_SEVERITY_AUTOMATON = _build_severity_automaton()
+
+
+@functools.lru_cache(maxsize=4096)
+def _infer_severity(plugin_name: str, title: str, message: str) -> str:
+    """
+    Infer a severity from keywords in a result's plugin, title and message
+
+    Memoized because a plugin reports the same text for many resources and
+    regions; the keywords are fixed, so cached answers never go stale.
+
+    Args:
+        plugin_name: Plugin name
+        title: Result title
+        message: Result message
+
+    Returns:
+        Severity level: 'critical', 'high', 'medium', or 'low'
+    """
+    if not (plugin_name or title or message):
+        return 'medium'
+    # Lowercase the text once; NUL separators keep a multi-word keyword
+    # from matching across the end of one field and the start of the next
+    text = f"{plugin_name}\x00{title}\x00{message}".lower()
+
+    if _SEVERITY_AUTOMATON is not None:
+        rank = min((rank for _, rank in _SEVERITY_AUTOMATON.iter(text)), default=None)
+        return _SEVERITY_KEYWORDS[rank][0] if rank is not None else 'medium'
+
+    # str.__contains__ is a C substring search; measured faster than a
+    # regex alternation per tier, which has to try every keyword at each offset
+    contains = text.__contains__
+    for severity, keywords in _SEVERITY_KEYWORDS:
+        if any(map(contains, keywords)):
+            return severity
+
+    # Default to medium
+    return 'medium'
+
+
+# Scan timeout in seconds (1 hour)
+_SCAN_TIMEOUT = 3600
+
+# Output files at least this large are streamed with ijson when it is
+# installed; smaller ones are faster to load whole
+_STREAM_MIN_BYTES = 64 * 1024 * 1024
+
+# Result statuses reported as failed checks
+_FAIL_STATUSES = frozenset(('FAIL', 'WARN', 'UNKNOWN'))
+
+# CloudSploit config for GCP scans, using the credential_file format
+# (simpler and works correctly); %s is the JS string literal of the key path
+_GCP_CONFIG_TEMPLATE = """// CloudSploit config for GCP
+module.exports = {
+    credentials: {
+        alibaba: {},
+        aws: {},
+        aws_remediate: {},
+        azure: {},
+        azure_remediate: {},
+        google_remediate: {},
+        google: {
+            credential_file: %s
+        },
+        oracle: {},
+        github: {}
+    }
+};
+"""
+
+
+def _finding_from_result(result: Dict, severity: str, status: str, plugin: str,
+                         default_title: str, category: str) -> Dict:
+    """
+    Build the finding stored for a failed CloudSploit result
+
+    Args:
+        result: CloudSploit result dictionary
+        severity: Severity determined for the result
+        status: Result status
+        plugin: Plugin name, or None to read it from the result
+        default_title: Title used when the result has none
+        category: Plugin category, or None to read it from the result
+
+    Returns:
+        Finding dictionary
+    """
+    get = result.get
+    return {
+        'plugin': get('plugin', 'N/A') if plugin is None else plugin,
+        'title': get('title', default_title),
+        'category': get('category', 'N/A') if category is None else category,
+        'severity': severity,
+        'status': status,
+        'message': get('message', 'N/A'),
+        'resource': get('resource', 'N/A'),
+        'region': get('region', 'global')
+    }
+
+
+def _iter_results(data):
+    """
+    Flatten CloudSploit output into individual results
+
+    CloudSploit writes either an array of plugin results (each with plugin,
+    category, title, resource, region, status, message) or an object keyed
+    by plugin name whose values are a single result or hold nested results.
+
+    Args:
+        data: Parsed CloudSploit output
+
+    Returns:
+        Iterator of (result, plugin name, default title, category) tuples.
+        Plugin name and category are None when they are fields of the
+        result itself, so they are only looked up for failed checks.
+    """
+    if isinstance(data, list):
+        return _iter_array_results(data)
+    if isinstance(data, dict):
+        return _iter_plugin_results(data.items())
+    return iter(())
+
+
+def _iter_array_results(results):
+    """Yield result tuples from CloudSploit's array output"""
+    for result in results:
+        if isinstance(result, dict):
+            yield result, None, 'N/A', None
+
+
+def _iter_plugin_results(plugins):
+    """Yield result tuples from (plugin name, plugin data) pairs"""
+    # Alternative format: plugin name as key
+    for plugin_name, plugin_data in plugins:
+        if not isinstance(plugin_data, dict):
+            continue
+
+        category = plugin_data.get('category', 'N/A')
+        # Check if it's a plugin result or nested results
+        if 'status' in plugin_data:
+            yield plugin_data, plugin_name, plugin_name, category
+        elif 'results' in plugin_data:
+            for result in plugin_data.get('results', []):
+                yield result, plugin_name, plugin_name, category
+
+
+def _empty_summary(output_file: Path) -> Dict:
+    """Summary for a scan that produced no output"""
+    return {
+        'output_file': str(output_file),
+        'total_checks': 0,
+        'passed': 0,
+        'failed': 0,
+        'critical': 0,
+        'high': 0,
+        'medium': 0,
+        'low': 0,
+        'findings': []
+    }
+
+
+def _drain_fifo(path: str, chunks: List[bytes]):
+    """Read a named pipe until its writer closes it"""
+    with open(path, 'rb') as f:
+        chunks.append(f.read())
+
+
+def _unlink_quietly(path: str):
+    """Remove a file, ignoring it if it is already gone"""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=8)
+def _gcp_config_path(cred_file: str) -> str:
+    """
+    Write a CloudSploit GCP config file for a credential file
+
+    Memoized so repeated scans reuse one file per credential file; it is
+    removed when the interpreter exits.
+
+    Args:
+        cred_file: Path to the GCP service account key file
+
+    Returns:
+        Path to the config file
+    """
+    # A JSON string is a valid JS string literal, so json.dumps takes care
+    # of backslashes and quotes in the path
+    config_content = _GCP_CONFIG_TEMPLATE % json.dumps(cred_file)
+
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.js', delete=False) as f:
+        f.write(config_content)
+
+    atexit.register(_unlink_quietly, f.name)
+    return f.name
 
 
 class CloudSploitScanner:
-    """Wrapper for CloudSploit security scanner"""
+    """
+    Wrapper for CloudSploit security scanner
+
+    Thread-safe: each scan writes to its own output path, the instance keeps
+    no results between scans and result cache entries are replaced
+    atomically, so one instance may run scans for several providers at once
+    alongside the other scanner.
+    """
 
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, parse_executor: Optional[Executor] = None):
         """
         Initialize CloudSploit scanner
 
         Args:
             config: Configuration dictionary
+            parse_executor: Process pool for parsing scan output (optional)
         """
         self.config = config
         self.logger = logging.getLogger(__name__)
         self.output_dir = Path(config['scanners']['cloudsploit']['output_dir'])
+        self._ts_fmt = config['output']['timestamp_format']
         self.output_dir.mkdir(parents=True, exist_ok=True)
-
-    def scan(self, provider: str, **kwargs) -> Dict:
+        self.parse_executor = parse_executor
+        self.findings_jsonl = config['scanners']['cloudsploit'].get('findings_jsonl', False)
+        ttl = config['scanners']['cloudsploit'].get('result_cache_ttl', 0)
+        self._result_cache = ResultCache(self.output_dir / '.cache', ttl) if ttl else None
+        # Named pipes are POSIX only; elsewhere output always goes through a file
+        self.stream_output = (config['scanners']['cloudsploit'].get('stream_output', False)
+                              and hasattr(os, 'mkfifo'))
+
+    def __getstate__(self) -> Dict:
+        """Drop the parse executor when pickled into a worker process"""
+        state = self.__dict__.copy()
+        state['parse_executor'] = None
+        return state
+
+    def _stamped_path(self, provider: str, scan_id: str) -> Path:
+        """Output .json file path for a provider scan"""
+        return self.output_dir / f"cloudsploit_{provider}_{scan_id}.json"
+
+    def scan(self, provider: str, out_buf: Optional[bytearray] = None,
+             scan_id: Optional[str] = None, **kwargs) -> Dict:
         """
         Execute CloudSploit scan for specified cloud provider
 
         Args:
             provider: Cloud provider ('aws', 'azure', 'gcp', or 'oracle')
+            out_buf: Reusable buffer for reading scan output (optional)
+            scan_id: Timestamp used in output file names (optional, defaults to now)
             **kwargs: Additional provider-specific arguments
 
         Returns:
             Dictionary containing scan results
         """
-        self.logger.info(f"Starting CloudSploit scan for {provider.upper()}")
+        self.logger.info("Starting CloudSploit scan for %s", provider.upper())
+
+        if scan_id is None:
+            scan_id = datetime.now().strftime(self._ts_fmt)
 
-        # Build CloudSploit command based on provider
+        # Pick the CloudSploit scan for the provider
         if provider == 'gcp':
-            return self._scan_gcp(**kwargs)
+            scan_provider = self._scan_gcp
         elif provider == 'aws':
-            return self._scan_aws(**kwargs)
+            scan_provider = self._scan_aws
         elif provider == 'azure':
-            return self._scan_azure(**kwargs)
+            scan_provider = self._scan_azure
         else:
-            raise ValueError(f"Unsupported provider: {provider}")
-
-    def _scan_gcp(self, project_id: Optional[str] = None) -> Dict:
+            raise ScannerError(f"Unsupported provider: {provider}")
+
+        # Reuse the results of an identical scan that finished recently
+        cache_key = None
+        if self._result_cache is not None:
+            cache_key = self._result_cache.key(provider, kwargs, self.config['scanners']['cloudsploit'],
+                                               self.config['providers'].get(provider))
+            results = self._result_cache.get(cache_key)
+            if results is not None:
+                self.logger.info("Reusing CloudSploit results for %s from the last %ss",
+                                 provider.upper(), self._result_cache.ttl)
+                return results
+
+        results = scan_provider(scan_id, out_buf=out_buf, **kwargs)
+        if cache_key is not None:
+            self._result_cache.put(cache_key, results)
+        return results
+
+    def _scan_gcp(self, scan_id: str, project_id: Optional[str] = None,
+                  out_buf: Optional[bytearray] = None) -> Dict:
         """
         Scan GCP environment
 
         Args:
+            scan_id: Timestamp used in output file names
             project_id: GCP project ID
+            out_buf: Reusable buffer for reading scan output (optional)
 
         Returns:
             Scan results dictionary
         """
-        timestamp = datetime.now().strftime(self.config['output']['timestamp_format'])
-        output_file = self.output_dir / f"cloudsploit_gcp_{timestamp}.json"
+        output_file = self._stamped_path('gcp', scan_id)
 
         # CloudSploit needs a config file to specify GCP credentials
         cred_file = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS')
@@ -70,69 +383,48 @@ class CloudSploitScanner:
             self.logger.error("GOOGLE_APPLICATION_CREDENTIALS environment variable not set")
             return {'error': 'GOOGLE_APPLICATION_CREDENTIALS not set'}
 
-        self.logger.info(f"CloudSploit will use credentials from: {cred_file}")
-
-        # Create temporary config file for CloudSploit
-        # Use credential_file format (simpler and works correctly)
-        config_content = f"""// CloudSploit config for GCP
-module.exports = {{
-    credentials: {{
-        alibaba: {{}},
-        aws: {{}},
-        aws_remediate: {{}},
-        azure: {{}},
-        azure_remediate: {{}},
-        google_remediate: {{}},
-        google: {{
-            credential_file: '{cred_file.replace(chr(92), '/')}'
-        }},
-        oracle: {{}},
-        github: {{}}
-    }}
-}};
-"""
+        self.logger.info("CloudSploit will use credentials from: %s", cred_file)
 
-        # Write config to temp file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.js', delete=False) as f:
-            f.write(config_content)
-            config_file = f.name
+        # CloudSploit needs a JS config file naming the credentials; it is
+        # written once per credential file and reused for later scans
+        config_file = _gcp_config_path(cred_file)
+        if not os.path.exists(config_file):
+            # Removed from under us (e.g. by a temp directory cleaner)
+            _gcp_config_path.cache_clear()
+            config_file = _gcp_config_path(cred_file)
 
-        try:
-            # Build CloudSploit command using node directly
-            # CloudSploit is installed at C:/Users/alan/cloudsploit/
-            cloudsploit_path = 'C:/Users/alan/cloudsploit/index.js'
-
-            cmd = [
-                'node',
-                cloudsploit_path,
-                '--config', config_file,
-                '--json', str(output_file),
-                '--console', 'none'
-            ]
-
-            # Execute CloudSploit
-            result = self._execute_cloudsploit(cmd, output_file)
-            return result
-        finally:
-            # Clean up temp config file
-            try:
-                os.unlink(config_file)
-            except:
-                pass
+        # Build CloudSploit command using node directly
+        # CloudSploit is installed at C:/Users/alan/cloudsploit/
+        cloudsploit_path = 'C:/Users/alan/cloudsploit/index.js'
+
+        cmd = [
+            'node',
+            cloudsploit_path,
+            '--config', config_file,
+            '--json', str(output_file),
+            '--console', 'none'
+        ]
 
-    def _scan_aws(self, profile: Optional[str] = None, regions: Optional[List[str]] = None) -> Dict:
+        # Execute CloudSploit
+        result = self._execute_cloudsploit(cmd, output_file, out_buf)
+        return result
+
+    def _scan_aws(self, scan_id: str, profile: Optional[str] = None,
+                  regions: Optional[List[str]] = None,
+                  out_buf: Optional[bytearray] = None) -> Dict:
         """
         Scan AWS environment
 
         Args:
+            scan_id: Timestamp used in output file names
             profile: AWS profile name
             regions: List of AWS regions to scan
+            out_buf: Reusable buffer for reading scan output (optional)
 
         Returns:
             Scan results dictionary
         """
-        timestamp = datetime.now().strftime(self.config['output']['timestamp_format'])
-        output_file = self.output_dir / f"cloudsploit_aws_{timestamp}.json"
+        output_file = self._stamped_path('aws', scan_id)
 
         # Build CloudSploit command
         cmd = [
@@ -143,21 +435,23 @@ module.exports = {{
         ]
 
         # Execute CloudSploit
-        result = self._execute_cloudsploit(cmd, output_file)
+        result = self._execute_cloudsploit(cmd, output_file, out_buf)
         return result
 
-    def _scan_azure(self, subscription_id: Optional[str] = None) -> Dict:
+    def _scan_azure(self, scan_id: str, subscription_id: Optional[str] = None,
+                    out_buf: Optional[bytearray] = None) -> Dict:
         """
         Scan Azure environment
 
         Args:
+            scan_id: Timestamp used in output file names
             subscription_id: Azure subscription ID
+            out_buf: Reusable buffer for reading scan output (optional)
 
         Returns:
             Scan results dictionary
         """
-        timestamp = datetime.now().strftime(self.config['output']['timestamp_format'])
-        output_file = self.output_dir / f"cloudsploit_azure_{timestamp}.json"
+        output_file = self._stamped_path('azure', scan_id)
 
         # Build CloudSploit command
         cmd = [
@@ -168,42 +462,74 @@ module.exports = {{
         ]
 
         # Execute CloudSploit
-        result = self._execute_cloudsploit(cmd, output_file)
+        result = self._execute_cloudsploit(cmd, output_file, out_buf)
         return result
 
-    def _execute_cloudsploit(self, cmd: List[str], output_file: Path) -> Dict:
+    def _execute_cloudsploit(self, cmd: List[str], output_file: Path,
+                             out_buf: Optional[bytearray] = None) -> Dict:
         """
         Execute CloudSploit command and parse results
 
         Args:
             cmd: Command list to execute
             output_file: File where CloudSploit will save output
+            out_buf: Reusable buffer for reading scan output (optional)
 
         Returns:
             Parsed scan results
         """
+        fifo_dir = None
         try:
-            self.logger.info(f"Executing: {' '.join(cmd)}")
+            if self.stream_output:
+                # Have CloudSploit write into a named pipe that a helper
+                # thread drains, so the output never touches the disk
+                fifo_dir = tempfile.mkdtemp(prefix='cloudsploit_')
+                fifo = os.path.join(fifo_dir, output_file.name)
+                os.mkfifo(fifo)
+                cmd = [fifo if arg == str(output_file) else arg for arg in cmd]
+                chunks = []
+                reader = threading.Thread(target=_drain_fifo, args=(fifo, chunks), daemon=True)
+                reader.start()
+
+            # Joining a long command line is skipped when INFO is muted
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Executing: %s", ' '.join(cmd))
 
-            # Run CloudSploit with environment variables
-            process = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=3600,  # 1 hour timeout
-                env=os.environ.copy()  # Pass environment variables for credentials
-            )
+            try:
+                # Run CloudSploit; it inherits our environment, credentials
+                # included. Results go to the --json file, so stdout is
+                # discarded and only the tail of stderr is kept for diagnostics
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE
+                )
+                returncode, stderr = wait_for_scan(process, _SCAN_TIMEOUT)
+            finally:
+                if fifo_dir is not None:
+                    self._close_fifo(fifo, reader)
 
             # CloudSploit returns 0 even with findings
-            self.logger.info(f"CloudSploit completed with exit code: {process.returncode}")
+            self.logger.info("CloudSploit completed with exit code: %s", returncode)
 
-            if process.returncode != 0:
-                self.logger.warning(f"CloudSploit stderr: {process.stderr}")
+            if returncode != 0:
+                # stderr is only decoded when it is going to be logged
+                self.logger.warning("CloudSploit stderr: %s", stderr.decode('utf-8', 'replace'))
                 # Don't fail on non-zero exit, CloudSploit might still have output
 
-            # Parse results
-            results = self._parse_cloudsploit_output(output_file)
-            return results
+            raw = b''.join(chunks) if fifo_dir is not None else None
+
+            # Absolute, since the report may be rendered from another working directory
+            findings_file = output_file.with_suffix('.findings.jsonl').resolve() if self.findings_jsonl else None
+
+            # Parse results, in a worker process if one is configured so the
+            # CPU-bound parse does not hold the GIL against the other scans
+            if self.parse_executor is not None:
+                return self.parse_executor.submit(
+                    self._parse_cloudsploit_output, output_file, None, raw, findings_file
+                ).result()
+
+            return self._parse_cloudsploit_output(output_file, out_buf, raw, findings_file)
 
         except FileNotFoundError:
             self.logger.error("CloudSploit not found. Install with: npm install -g cloudsploit")
@@ -212,128 +538,177 @@ module.exports = {{
             self.logger.error("CloudSploit scan timed out")
             return {'error': 'Scan timed out after 1 hour'}
         except Exception as e:
-            self.logger.error(f"Error executing CloudSploit: {str(e)}")
+            self.logger.error("Error executing CloudSploit: %s", e)
             return {'error': str(e)}
+        finally:
+            if fifo_dir is not None:
+                shutil.rmtree(fifo_dir, ignore_errors=True)
 
-    def _parse_cloudsploit_output(self, output_file: Path) -> Dict:
+    def _close_fifo(self, fifo: str, reader: threading.Thread):
         """
-        Parse CloudSploit JSON output
+        Wait for the pipe reader once CloudSploit has exited
+
+        If CloudSploit never opened the pipe the reader is still blocked
+        opening it, so the write end is opened briefly to release it.
 
         Args:
-            output_file: Path to CloudSploit output file
+            fifo: Path to the named pipe
+            reader: Thread draining the pipe
+        """
+        if reader.is_alive():
+            try:
+                os.close(os.open(fifo, os.O_WRONLY | os.O_NONBLOCK))
+            except OSError:
+                pass
+        reader.join()
+
+    def _load_json(self, f: BinaryIO, out_buf: Optional[bytearray] = None):
+        """
+        Load a JSON output file, reading through a reusable buffer if given
+
+        Args:
+            f: JSON file opened in binary mode
+            out_buf: Pooled buffer to read the file into (optional)
 
         Returns:
-            Parsed results dictionary
+            Parsed JSON content
         """
-        try:
-            if not output_file.exists():
-                self.logger.warning(f"CloudSploit output file not found: {output_file}")
-                return {
-                    'output_file': str(output_file),
-                    'failed': 0,
-                    'critical': 0,
-                    'high': 0,
-                    'medium': 0,
-                    'low': 0,
-                    'findings': []
-                }
-
-            self.logger.info(f"Parsing CloudSploit results from {output_file}")
-
-            with open(output_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+        return _loads(f.read() if out_buf is None else read_into(f, out_buf))
 
-            # Aggregate results - simplified to match Prowler output
-            summary = {
-                'output_file': str(output_file),
-                'failed': 0,
-                'critical': 0,
-                'high': 0,
-                'medium': 0,
-                'low': 0,
-                'findings': []
-            }
+    def _read_results(self, output_file: Path, out_buf: Optional[bytearray] = None,
+                      raw: Optional[bytes] = None):
+        """
+        Read CloudSploit output as individual results
+
+        Large files are streamed with ijson when it is installed, so each
+        result is parsed, counted and dropped before the next is read.
+
+        Args:
+            output_file: Path to CloudSploit output file
+            out_buf: Reusable buffer for reading scan output (optional)
+            raw: Output already read from a pipe (optional)
+
+        Yields:
+            Tuples of (result, plugin name, default title, category)
+
+        Raises:
+            FileNotFoundError: If output_file does not exist; raised before
+                anything is yielded
+        """
+        if raw is not None:
+            yield from _iter_results(_loads(raw))
+            return
+
+        # Open once and size the open file rather than stat'ing the path first
+        with open(output_file, 'rb') as f:
+            if _ijson is not None and os.fstat(f.fileno()).st_size >= _STREAM_MIN_BYTES:
+                # The first token tells which of the two layouts this is
+                head = f.read(64).lstrip()[:1]
+                f.seek(0)
+                if head == b'[':
+                    yield from _iter_array_results(_ijson.items(f, 'item', use_float=True))
+                    return
+                if head == b'{':
+                    yield from _iter_plugin_results(_ijson.kvitems(f, '', use_float=True))
+                    return
+
+            data = self._load_json(f, out_buf)
+
+        yield from _iter_results(data)
+
+    def _parse_cloudsploit_output(self, output_file: Path, out_buf: Optional[bytearray] = None,
+                                  raw: Optional[bytes] = None,
+                                  findings_file: Optional[Path] = None) -> Dict:
+        """
+        Parse CloudSploit JSON output
 
-            # CloudSploit output format: array of plugin results
-            # Each result has: plugin, category, title, description, resource, region, status, message
-            if isinstance(data, list):
-                for result in data:
-                    if not isinstance(result, dict):
-                        continue
+        Args:
+            output_file: Path to CloudSploit output file
+            out_buf: Reusable buffer for reading scan output (optional)
+            raw: Output already read from a pipe; output_file is then not read (optional)
+            findings_file: Write failed findings to this file as JSON lines
+                instead of returning them (optional)
 
+        Returns:
+            Parsed results dictionary. With findings_file, 'findings' is
+            replaced by 'findings_file' and 'findings_count'.
+        """
+        try:
+            # Piped output is empty when CloudSploit never wrote any
+            if raw is not None and not raw:
+                self.logger.warning("CloudSploit output file not found: %s", output_file)
+                return _empty_summary(output_file)
+
+            self.logger.info("Parsing CloudSploit results from %s", output_file)
+
+            # Count in locals and build the summary once at the end; plain
+            # int increments are much cheaper than dict item updates
+            total_checks = passed = failed = critical = high = medium = low = 0
+            findings = []
+            emit = findings.append
+            determine_severity = self._determine_severity
+
+            sink = open(findings_file, 'wb') if findings_file is not None else contextlib.nullcontext()
+            with sink:
+                if findings_file is not None:
+                    # Stream findings to disk so they are never all held in memory
+                    def emit(record, write=sink.write):
+                        write(_dumps(record) + b'\n')
+
+                # Every output shape is flattened into the same result tuples
+                for result, plugin, default_title, category in self._read_results(output_file, out_buf, raw):
                     status = result.get('status', 'UNKNOWN')
+                    total_checks += 1
 
                     # Only count FAIL and WARN as failures
-                    if status in ['FAIL', 'WARN', 'UNKNOWN']:
-                        summary['failed'] += 1
+                    if status == 'OK':
+                        passed += 1
+                    elif status in _FAIL_STATUSES:
+                        failed += 1
 
                         # Determine severity
-                        severity = self._determine_severity(result)
-                        summary[severity] += 1
+                        severity = determine_severity(result)
+                        if severity == 'critical':
+                            critical += 1
+                        elif severity == 'high':
+                            high += 1
+                        elif severity == 'low':
+                            low += 1
+                        else:
+                            medium += 1
 
                         # Store finding
-                        summary['findings'].append({
-                            'plugin': result.get('plugin', 'N/A'),
-                            'title': result.get('title', 'N/A'),
-                            'category': result.get('category', 'N/A'),
-                            'severity': severity,
-                            'status': status,
-                            'message': result.get('message', 'N/A'),
-                            'resource': result.get('resource', 'N/A'),
-                            'region': result.get('region', 'global')
-                        })
-
-            elif isinstance(data, dict):
-                # Alternative format: plugin name as key
-                for plugin_name, plugin_data in data.items():
-                    if not isinstance(plugin_data, dict):
-                        continue
-
-                    # Check if it's a plugin result or nested results
-                    if 'status' in plugin_data:
-                        status = plugin_data.get('status', 'UNKNOWN')
-
-                        if status in ['FAIL', 'WARN', 'UNKNOWN']:
-                            summary['failed'] += 1
-                            severity = self._determine_severity(plugin_data)
-                            summary[severity] += 1
-
-                            summary['findings'].append({
-                                'plugin': plugin_name,
-                                'title': plugin_data.get('title', plugin_name),
-                                'category': plugin_data.get('category', 'N/A'),
-                                'severity': severity,
-                                'status': status,
-                                'message': plugin_data.get('message', 'N/A'),
-                                'resource': plugin_data.get('resource', 'N/A'),
-                                'region': plugin_data.get('region', 'global')
-                            })
-                    elif 'results' in plugin_data:
-                        # Nested results
-                        for result in plugin_data.get('results', []):
-                            status = result.get('status', 'UNKNOWN')
-
-                            if status in ['FAIL', 'WARN', 'UNKNOWN']:
-                                summary['failed'] += 1
-                                severity = self._determine_severity(result)
-                                summary[severity] += 1
-
-                                summary['findings'].append({
-                                    'plugin': plugin_name,
-                                    'title': result.get('title', plugin_name),
-                                    'category': plugin_data.get('category', 'N/A'),
-                                    'severity': severity,
-                                    'status': status,
-                                    'message': result.get('message', 'N/A'),
-                                    'resource': result.get('resource', 'N/A'),
-                                    'region': result.get('region', 'global')
-                                })
-
-            self.logger.info(f"CloudSploit found {summary['failed']} failed checks")
+                        emit(_finding_from_result(
+                            result, severity, status, plugin, default_title, category
+                        ))
+
+            # Aggregate results - simplified to match Prowler output
+            summary = {
+                'output_file': str(output_file),
+                'total_checks': total_checks,
+                'passed': passed,
+                'failed': failed,
+                'critical': critical,
+                'high': high,
+                'medium': medium,
+                'low': low
+            }
+            if findings_file is None:
+                summary['findings'] = findings
+            else:
+                summary['findings_file'] = str(findings_file)
+                summary['findings_count'] = failed
+
+            self.logger.info("CloudSploit found %d failed checks", failed)
             return summary
 
+        except FileNotFoundError:
+            # Raised when the output is missing, before any result is counted
+            self.logger.warning("CloudSploit output file not found: %s", output_file)
+            return _empty_summary(output_file)
+
         except Exception as e:
-            self.logger.error(f"Error parsing CloudSploit output: {str(e)}")
+            self.logger.error("Error parsing CloudSploit output: %s", e)
             return {
                 'error': f"Failed to parse results: {str(e)}",
                 'output_file': str(output_file)
@@ -349,32 +724,14 @@ module.exports = {{
         Returns:
             Severity level: 'critical', 'high', 'medium', or 'low'
         """
+        get = result.get
+
         # Check if severity is provided in result
-        if 'severity' in result:
-            severity = result['severity'].lower()
-            if severity in ['critical', 'high', 'medium', 'low']:
+        severity = get('severity')
+        if severity:
+            severity = _SEVERITY_NAMES.get(severity) or _SEVERITY_NAMES.get(severity.lower())
+            if severity is not None:
                 return severity
 
         # Fallback to keyword-based detection
-        plugin_name = result.get('plugin', '').lower()
-        title = result.get('title', '').lower()
-        message = result.get('message', '').lower()
-        text = f"{plugin_name} {title} {message}"
-
-        # Critical keywords
-        critical_keywords = ['exposed', 'public', 'encryption disabled', 'mfa disabled', 'no encryption', 'open to world']
-        if any(keyword in text for keyword in critical_keywords):
-            return 'critical'
-
-        # High keywords
-        high_keywords = ['vulnerable', 'insecure', 'weak', 'misconfigured', 'missing encryption', 'unencrypted']
-        if any(keyword in text for keyword in high_keywords):
-            return 'high'
-
-        # Low keywords
-        low_keywords = ['logging', 'monitoring', 'tag', 'label']
-        if any(keyword in text for keyword in low_keywords):
-            return 'low'
-
-        # Default to medium
-        return 'medium'
+        return _infer_severity(get('plugin') or '', get('title') or '', get('message') or '')
@@ -3,66 +3,204 @@ Prowler Scanner Integration
 Provides runtime security scanning for AWS, Azure, and GCP
 """
 
+import contextlib
 import json
 import logging
 import os
+import shutil
 import subprocess
 from datetime import datetime
 from pathlib import Path
+from concurrent.futures import Executor, ThreadPoolExecutor
 from typing import Dict, List, Optional
 
+from scanners import ResultCache, ScannerError, read_into, wait_for_scan
+
+# Prefer orjson for parsing scan output when it is installed
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+    def _dumps(obj) -> bytes:
+        """Serialize to compact JSON bytes, like orjson.dumps"""
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# ijson lets very large output files be parsed incrementally
+try:
+    import ijson as _ijson
+except ImportError:
+    _ijson = None
+
+# pysimdjson parses lazily: only the fields actually read from a finding
+# are turned into Python objects
+try:
+    import simdjson as _simdjson
+except ImportError:
+    _simdjson = None
+
+# AWS services Prowler checks account-wide rather than per region; when
+# regions are scanned in parallel only the first region's process runs them
+_AWS_GLOBAL_SERVICES = ('account', 'cloudfront', 'iam', 'organizations', 'route53',
+                        'shield', 'trustedadvisor')
+
+# Counters summed when merging per-region results
+_COUNT_KEYS = ('total_checks', 'passed', 'failed', 'critical', 'high', 'medium', 'low')
+
+# Severities counted in the summary; others (e.g. informational) are not
+_SEVERITIES = frozenset(('critical', 'high', 'medium', 'low'))
+
+# Spellings Prowler uses for the counted severities and statuses, mapped to
+# one shared string each so findings do not each hold a fresh copy
+_SEVERITY_NAMES = {variant: name for name in _SEVERITIES
+                   for variant in (name, name.title(), name.upper())}
+_STATUS_CODES = {variant: name for name in ('PASS', 'FAIL')
+                 for variant in (name, name.title(), name.lower())}
+
+# File failed findings are written to when findings_jsonl is enabled
+_FINDINGS_FILE = 'findings.jsonl'
+
+# Scan timeout in seconds (1 hour)
+_SCAN_TIMEOUT = 3600
+
+# Output files at least this large are streamed with ijson when it is
+# installed; smaller ones are faster to load whole
+_STREAM_MIN_BYTES = 64 * 1024 * 1024
+
+
+def _latest_json(root: Path) -> Optional[Path]:
+    """
+    Find the most recently modified .json file anywhere under a directory
+
+    Walks the tree with os.scandir in a single pass, so only the JSON files
+    are stat'ed and no intermediate list of paths is built.
+
+    Args:
+        root: Directory to search
+
+    Returns:
+        Path to the newest JSON file, or None if there is none
+    """
+    best_mtime = None
+    best_path = None
+    pending = [root]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith('.json'):
+                    mtime = entry.stat().st_mtime
+                    if best_mtime is None or mtime > best_mtime:
+                        best_mtime, best_path = mtime, entry.path
+
+    return Path(best_path) if best_path is not None else None
+
 
 class ProwlerScanner:
-    """Wrapper for Prowler security scanner"""
+    """
+    Wrapper for Prowler security scanner
+
+    Thread-safe: each scan writes to its own output path, the instance keeps
+    no results between scans and result cache entries are replaced
+    atomically, so one instance may run scans for several providers at once
+    alongside the other scanner.
+    """
 
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, parse_executor: Optional[Executor] = None):
         """
         Initialize Prowler scanner
 
         Args:
             config: Configuration dictionary
+            parse_executor: Process pool for parsing scan output (optional)
         """
         self.config = config
         self.logger = logging.getLogger(__name__)
         self.output_dir = Path(config['scanners']['prowler']['output_dir'])
         self.severity_threshold = config['scanners']['prowler'].get('severity_threshold', 'medium')
-
-    def scan(self, provider: str, **kwargs) -> Dict:
+        self.parse_executor = parse_executor
+        self.findings_jsonl = config['scanners']['prowler'].get('findings_jsonl', False)
+        self._ts_fmt = config['output']['timestamp_format']
+        self._aws_config = config['providers'].get('aws', {})
+        ttl = config['scanners']['prowler'].get('result_cache_ttl', 0)
+        self._result_cache = ResultCache(self.output_dir / '.cache', ttl) if ttl else None
+
+    def __getstate__(self) -> Dict:
+        """Drop the parse executor when pickled into a worker process"""
+        state = self.__dict__.copy()
+        state['parse_executor'] = None
+        return state
+
+    def _stamped_path(self, provider: str, scan_id: str) -> Path:
+        """Output directory path for a provider scan"""
+        return self.output_dir / f"prowler_{provider}_{scan_id}"
+
+    def scan(self, provider: str, out_buf: Optional[bytearray] = None,
+             scan_id: Optional[str] = None, **kwargs) -> Dict:
         """
         Execute Prowler scan for specified cloud provider
 
         Args:
             provider: Cloud provider ('aws', 'azure', or 'gcp')
+            out_buf: Reusable buffer for reading scan output (optional)
+            scan_id: Timestamp used in output file names (optional, defaults to now)
             **kwargs: Additional provider-specific arguments
 
         Returns:
             Dictionary containing scan results
         """
-        self.logger.info(f"Starting Prowler scan for {provider.upper()}")
+        self.logger.info("Starting Prowler scan for %s", provider.upper())
+
+        if scan_id is None:
+            scan_id = datetime.now().strftime(self._ts_fmt)
 
-        # Build Prowler command based on provider
+        # Pick the Prowler scan for the provider
         if provider == 'aws':
-            return self._scan_aws(**kwargs)
+            scan_provider = self._scan_aws
         elif provider == 'azure':
-            return self._scan_azure(**kwargs)
+            scan_provider = self._scan_azure
         elif provider == 'gcp':
-            return self._scan_gcp(**kwargs)
+            scan_provider = self._scan_gcp
         else:
-            raise ValueError(f"Unsupported provider: {provider}")
-
-    def _scan_aws(self, profile: Optional[str] = None, regions: Optional[List[str]] = None) -> Dict:
+            raise ScannerError(f"Unsupported provider: {provider}")
+
+        # Reuse the results of an identical scan that finished recently
+        cache_key = None
+        if self._result_cache is not None:
+            cache_key = self._result_cache.key(provider, kwargs, self.config['scanners']['prowler'],
+                                               self.config['providers'].get(provider))
+            results = self._result_cache.get(cache_key)
+            if results is not None:
+                self.logger.info("Reusing Prowler results for %s from the last %ss",
+                                 provider.upper(), self._result_cache.ttl)
+                return results
+
+        results = scan_provider(scan_id, out_buf=out_buf, **kwargs)
+        if cache_key is not None:
+            self._result_cache.put(cache_key, results)
+        return results
+
+    def _scan_aws(self, scan_id: str, profile: Optional[str] = None,
+                  regions: Optional[List[str]] = None,
+                  out_buf: Optional[bytearray] = None) -> Dict:
         """
         Scan AWS environment
 
         Args:
+            scan_id: Timestamp used in output file names
             profile: AWS profile name
             regions: List of AWS regions to scan
+            out_buf: Reusable buffer for reading scan output (optional)
 
         Returns:
             Scan results dictionary
         """
-        timestamp = datetime.now().strftime(self.config['output']['timestamp_format'])
-        output_file = self.output_dir / f"prowler_aws_{timestamp}"
+        output_file = self._stamped_path('aws', scan_id)
 
         # Build Prowler command
         cmd = [
@@ -81,33 +219,116 @@ class ProwlerScanner:
         if profile:
             cmd.extend(['--profile', profile])
 
+        # Services filter, if specified
+        provider_config = self._aws_config
+        services = provider_config.get('services')
+        if not services or services == 'all':
+            services = None
+
+        # Use the configured regions unless specified
+        if not regions and provider_config.get('regions') and provider_config['regions'] != 'all':
+            regions = provider_config['regions']
+
+        # Prowler sweeps regions one after another; if enabled, an explicit
+        # region list is split into one Prowler process per region
+        workers = min(len(regions or ()), provider_config.get('max_parallel_regions', 1))
+        if workers > 1:
+            return self._scan_aws_regions(cmd, output_file, regions, services, workers)
+
+        if services:
+            cmd.extend(['--services'] + services)
+
         # Add regions if specified
-        provider_config = self.config['providers']['aws']
         if regions:
             cmd.extend(['--region'] + regions)
-        elif provider_config.get('regions') and provider_config['regions'] != 'all':
-            cmd.extend(['--region'] + provider_config['regions'])
-
-        # Add services filter if specified
-        if provider_config.get('services') and provider_config['services'] != 'all':
-            cmd.extend(['--services'] + provider_config['services'])
 
         # Execute Prowler
-        result = self._execute_prowler(cmd, output_file)
+        result = self._execute_prowler(cmd, output_file, out_buf)
         return result
 
-    def _scan_azure(self, subscription_id: Optional[str] = None) -> Dict:
+    def _scan_aws_regions(self, cmd: List[str], output_dir: Path, regions: List[str],
+                          services: Optional[List[str]], workers: int) -> Dict:
+        """
+        Scan AWS regions concurrently and merge their results
+
+        Each region writes to its own subdirectory of the output directory.
+        Global services would report the same findings from every region,
+        so only the first region checks them.
+
+        Args:
+            cmd: Prowler command without a services or region filter
+            output_dir: Output directory of the whole scan
+            regions: AWS regions to scan
+            services: Services to check, or None for all
+            workers: Maximum number of concurrent Prowler processes
+
+        Returns:
+            Scan results dictionary
+        """
+        if services is None:
+            first_filter = []
+            other_filter = ['--excluded-services', *_AWS_GLOBAL_SERVICES]
+        else:
+            regional = [s for s in services if s not in _AWS_GLOBAL_SERVICES]
+            first_filter = ['--services', *services]
+            other_filter = ['--services', *regional]
+            if not regional:
+                # Only global services were requested; one region covers them
+                regions = regions[:1]
+
+        def scan_region(region: str) -> Dict:
+            region_dir = output_dir / region
+            region_cmd = [str(region_dir) if arg == str(output_dir) else arg for arg in cmd]
+            service_filter = first_filter if region == regions[0] else other_filter
+            return self._execute_prowler(region_cmd + service_filter + ['--region', region], region_dir)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            region_results = dict(zip(regions, pool.map(scan_region, regions)))
+
+        errors = {region: r['error'] for region, r in region_results.items() if 'error' in r}
+        if len(errors) == len(region_results):
+            return {'error': '; '.join(f"{region}: {error}" for region, error in errors.items())}
+
+        merged = {'output_dir': str(output_dir)}
+        merged.update((key, 0) for key in _COUNT_KEYS)
+        succeeded = [r for r in region_results.values() if 'error' not in r]
+        for results in succeeded:
+            for key in _COUNT_KEYS:
+                merged[key] += results[key]
+
+        if self.findings_jsonl:
+            # Concatenate the per-region findings files without loading them;
+            # the report may be rendered from another working directory
+            findings_file = (output_dir / _FINDINGS_FILE).resolve()
+            with open(findings_file, 'wb') as out:
+                for results in succeeded:
+                    with open(results['findings_file'], 'rb') as f:
+                        shutil.copyfileobj(f, out)
+            merged['findings_file'] = str(findings_file)
+            merged['findings_count'] = merged['failed']
+        else:
+            merged['findings'] = [f for results in succeeded for f in results['findings']]
+
+        if errors:
+            self.logger.warning("Prowler failed for some AWS regions: %s", errors)
+            merged['region_errors'] = errors
+
+        return merged
+
+    def _scan_azure(self, scan_id: str, subscription_id: Optional[str] = None,
+                    out_buf: Optional[bytearray] = None) -> Dict:
         """
         Scan Azure environment
 
         Args:
+            scan_id: Timestamp used in output file names
             subscription_id: Azure subscription ID
+            out_buf: Reusable buffer for reading scan output (optional)
 
         Returns:
             Scan results dictionary
         """
-        timestamp = datetime.now().strftime(self.config['output']['timestamp_format'])
-        output_file = self.output_dir / f"prowler_azure_{timestamp}"
+        output_file = self._stamped_path('azure', scan_id)
 
         # Build Prowler command
         cmd = [
@@ -127,21 +348,23 @@ class ProwlerScanner:
             cmd.extend(['--subscription-id', subscription_id])
 
         # Execute Prowler
-        result = self._execute_prowler(cmd, output_file)
+        result = self._execute_prowler(cmd, output_file, out_buf)
         return result
 
-    def _scan_gcp(self, project_id: Optional[str] = None) -> Dict:
+    def _scan_gcp(self, scan_id: str, project_id: Optional[str] = None,
+                  out_buf: Optional[bytearray] = None) -> Dict:
         """
         Scan GCP environment
 
         Args:
+            scan_id: Timestamp used in output file names
             project_id: GCP project ID
+            out_buf: Reusable buffer for reading scan output (optional)
 
         Returns:
             Scan results dictionary
         """
-        timestamp = datetime.now().strftime(self.config['output']['timestamp_format'])
-        output_file = self.output_dir / f"prowler_gcp_{timestamp}"
+        output_file = self._stamped_path('gcp', scan_id)
 
         # Build Prowler command
         cmd = [
@@ -160,73 +383,149 @@ class ProwlerScanner:
             cmd.extend(['--project-id', project_id])
 
         # Execute Prowler
-        result = self._execute_prowler(cmd, output_file)
+        result = self._execute_prowler(cmd, output_file, out_buf)
         return result
 
-    def _execute_prowler(self, cmd: List[str], output_dir: Path) -> Dict:
+    def _execute_prowler(self, cmd: List[str], output_dir: Path,
+                         out_buf: Optional[bytearray] = None) -> Dict:
         """
         Execute Prowler command and parse results
 
         Args:
             cmd: Command list to execute
             output_dir: Directory where Prowler will save output
+            out_buf: Reusable buffer for reading scan output (optional)
 
         Returns:
             Parsed scan results
         """
         try:
-            self.logger.info(f"Executing: {' '.join(cmd)}")
-
-            # Run Prowler with inherited environment variables
-            process = subprocess.run(
+            # Joining a long command line is skipped when INFO is muted
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Executing: %s", ' '.join(cmd))
+
+            # Run Prowler; it inherits our environment, credentials included,
+            # so no copy of it is made. Results go to the output directory,
+            # so its progress output on stdout is discarded and only the tail
+            # of stderr is kept for diagnostics
+            process = subprocess.Popen(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=3600,  # 1 hour timeout
-                env=os.environ.copy()  # Pass environment variables to subprocess
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
             )
+            returncode, stderr = wait_for_scan(process, _SCAN_TIMEOUT)
 
             # Prowler exit codes:
             # 0 = success with no findings
             # 3 = success with findings (security issues detected)
             # Other codes = actual errors
-            if process.returncode not in [0, 3]:
-                self.logger.error(f"Prowler scan failed: {process.stderr}")
+            if returncode not in [0, 3]:
+                stderr = stderr.decode('utf-8', 'replace')
+                self.logger.error("Prowler scan failed: %s", stderr)
                 return {
-                    'error': f"Prowler exited with code {process.returncode}",
-                    'stderr': process.stderr,
-                    'stdout': process.stdout
+                    'error': f"Prowler exited with code {returncode}",
+                    'stderr': stderr
                 }
 
-            # Parse results
-            results = self._parse_prowler_output(output_dir)
+            # Absolute, since the report may be rendered from another working directory
+            findings_file = (output_dir / _FINDINGS_FILE).resolve() if self.findings_jsonl else None
+
+            # Parse results, in a worker process if one is configured so the
+            # CPU-bound parse does not hold the GIL against the other scans
+            if self.parse_executor is not None:
+                return self.parse_executor.submit(
+                    self._parse_prowler_output, output_dir, None, findings_file
+                ).result()
+
+            results = self._parse_prowler_output(output_dir, out_buf, findings_file)
             return results
 
         except subprocess.TimeoutExpired:
             self.logger.error("Prowler scan timed out")
             return {'error': 'Scan timed out after 1 hour'}
         except Exception as e:
-            self.logger.error(f"Error executing Prowler: {str(e)}")
+            self.logger.error("Error executing Prowler: %s", e)
             return {'error': str(e)}
 
-    def _parse_prowler_output(self, output_dir: Path) -> Dict:
+    def _load_json(self, json_file: Path, out_buf: Optional[bytearray] = None):
+        """
+        Load a JSON output file, reading through a reusable buffer if given
+
+        Args:
+            json_file: Path to the JSON file
+            out_buf: Pooled buffer to read the file into (optional)
+
+        Returns:
+            Parsed JSON content
+        """
+        return _loads(self._read_bytes(json_file, out_buf))
+
+    def _read_bytes(self, json_file: Path, out_buf: Optional[bytearray] = None):
+        """
+        Read a file's raw bytes, into a reusable buffer if given
+
+        Args:
+            json_file: Path to the file
+            out_buf: Pooled buffer to read the file into (optional)
+
+        Returns:
+            The file content (out_buf itself when given)
+        """
+        with open(json_file, 'rb') as f:
+            return f.read() if out_buf is None else read_into(f, out_buf)
+
+    def _read_findings(self, json_file: Path, out_buf: Optional[bytearray] = None):
+        """
+        Read Prowler's OCSF output as individual findings
+
+        Large files are streamed with ijson when it is installed, so each
+        finding is parsed, counted and dropped before the next is read.
+        Otherwise pysimdjson, when installed, parses the document lazily so
+        the many OCSF fields the parser never reads are skipped.
+
+        Args:
+            json_file: Path to the OCSF JSON file
+            out_buf: Reusable buffer for reading scan output (optional)
+
+        Yields:
+            Finding dictionaries
+        """
+        if _ijson is not None and json_file.stat().st_size >= _STREAM_MIN_BYTES:
+            with open(json_file, 'rb') as f:
+                yield from _ijson.items(f, 'item', use_float=True)
+            return
+
+        if _simdjson is not None:
+            yield from _simdjson.Parser().parse(self._read_bytes(json_file, out_buf))
+            return
+
+        yield from self._load_json(json_file, out_buf)
+
+    def _parse_prowler_output(self, output_dir: Path, out_buf: Optional[bytearray] = None,
+                              findings_file: Optional[Path] = None) -> Dict:
         """
         Parse Prowler JSON output
 
         Args:
             output_dir: Directory containing Prowler output
+            out_buf: Reusable buffer for reading scan output (optional)
+            findings_file: Write failed findings to this file as JSON lines
+                instead of returning them (optional)
 
         Returns:
-            Parsed results dictionary
+            Parsed results dictionary. With findings_file, 'findings' is
+            replaced by 'findings_file' and 'findings_count'.
         """
         try:
-            # Find the JSON output file (OCSF format - contains only FAIL findings)
-            json_files = list(output_dir.glob('**/*.json'))
+            # Find the most recent JSON output file (OCSF format)
+            json_file = _latest_json(output_dir)
 
-            if not json_files:
-                self.logger.warning(f"No JSON output found in {output_dir}")
+            if json_file is None:
+                self.logger.warning("No JSON output found in %s", output_dir)
                 return {
                     'output_dir': str(output_dir),
+                    'total_checks': 0,
+                    'passed': 0,
                     'failed': 0,
                     'critical': 0,
                     'high': 0,
@@ -235,61 +534,75 @@ class ProwlerScanner:
                     'findings': []
                 }
 
-            # Use the most recent JSON file
-            json_file = max(json_files, key=lambda p: p.stat().st_mtime)
-            self.logger.info(f"Parsing Prowler results from {json_file}")
-
-            with open(json_file, 'r') as f:
-                findings = json.load(f)
+            self.logger.info("Parsing Prowler results from %s", json_file)
 
             # Aggregate results
-            # Note: JSON-OCSF only contains FAIL findings
-            failed_count = len(findings)
+            # Note: scans run with --status PASS FAIL, so both are present
             summary = {
                 'output_dir': str(output_dir),
-                'failed': failed_count,
+                'total_checks': 0,
+                'passed': 0,
+                'failed': 0,
                 'critical': 0,
                 'high': 0,
                 'medium': 0,
-                'low': 0,
-                'findings': []
+                'low': 0
             }
-
-            for finding in findings:
-                # Prowler OCSF format uses different field names
-                # Note: JSON-OCSF only contains FAIL findings, no PASS findings
-                status_code = finding.get('status_code', '').upper()
-                severity = finding.get('severity', '').lower()
-
-                # All findings in JSON-OCSF are FAILs
-                if status_code == 'FAIL':
-
-                    # Count by severity
-                    if severity == 'critical':
-                        summary['critical'] += 1
-                    elif severity == 'high':
-                        summary['high'] += 1
-                    elif severity == 'medium':
-                        summary['medium'] += 1
-                    elif severity == 'low':
-                        summary['low'] += 1
-
-                    # Store failed findings
-                    summary['findings'].append({
-                        'check_id': finding.get('metadata', {}).get('event_code', 'N/A'),
-                        'check_title': finding.get('message', 'N/A'),
-                        'severity': severity,
-                        'status': status_code,
-                        'resource': finding.get('resources', [{}])[0].get('uid', 'N/A') if finding.get('resources') else 'N/A',
-                        'region': finding.get('cloud', {}).get('region', 'N/A'),
-                        'description': finding.get('status_detail', 'N/A'),
-                        'remediation': finding.get('remediation', {}).get('desc', 'N/A')
-                    })
+            findings = []
+            emit = findings.append
+
+            sink = open(findings_file, 'wb') if findings_file is not None else contextlib.nullcontext()
+            with sink:
+                if findings_file is not None:
+                    # Stream findings to disk so they are never all held in memory
+                    def emit(record, write=sink.write):
+                        write(_dumps(record) + b'\n')
+
+                for finding in self._read_findings(json_file, out_buf):
+                    summary['total_checks'] += 1
+
+                    # Prowler OCSF format uses different field names
+                    status_code = finding.get('status_code', '')
+                    status_code = _STATUS_CODES.get(status_code) or status_code.upper()
+
+                    if status_code == 'PASS':
+                        summary['passed'] += 1
+                    elif status_code == 'FAIL':
+                        summary['failed'] += 1
+                        raw_severity = finding.get('severity', '')
+                        resources = finding.get('resources')
+
+                        # Count by severity; lowercasing is only needed for
+                        # spellings the lookup table does not cover
+                        severity = _SEVERITY_NAMES.get(raw_severity)
+                        if severity is None:
+                            severity = raw_severity.lower()
+                            severity = _SEVERITY_NAMES.get(severity, severity)
+                        if severity in _SEVERITIES:
+                            summary[severity] += 1
+
+                        # Store failed findings
+                        emit({
+                            'check_id': finding.get('metadata', {}).get('event_code', 'N/A'),
+                            'check_title': finding.get('message', 'N/A'),
+                            'severity': severity,
+                            'status': status_code,
+                            'resource': resources[0].get('uid', 'N/A') if resources else 'N/A',
+                            'region': finding.get('cloud', {}).get('region', 'N/A'),
+                            'description': finding.get('status_detail', 'N/A'),
+                            'remediation': finding.get('remediation', {}).get('desc', 'N/A')
+                        })
+
+            if findings_file is None:
+                summary['findings'] = findings
+            else:
+                summary['findings_file'] = str(findings_file)
+                summary['findings_count'] = summary['failed']
 
             return summary
 
         except Exception as e:
-            self.logger.error(f"Error parsing Prowler output: {str(e)}")
+            self.logger.error("Error parsing Prowler output: %s", e)
             return {
                 'error': f"Failed to parse results: {str(e)}",
                 'output_dir': str(output_dir)
@@ -2,10 +2,111 @@
 Configuration Loader
 """
 
+import functools
+import json
+import os
+import tempfile
 import yaml
 from pathlib import Path
 from typing import Dict
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+def _copy_tree(obj):
+    """
+    Copy the dicts and lists of a parsed document, sharing everything else
+
+    Parsed YAML and JSON only nest dicts and lists around immutable
+    scalars, so this gives the same result as copy.deepcopy without its
+    memo bookkeeping.
+
+    Args:
+        obj: Parsed document or a value inside it
+
+    Returns:
+        Copy that can be modified without affecting obj
+    """
+    if type(obj) is dict:
+        return {key: _copy_tree(value) for key, value in obj.items()}
+    if type(obj) is list:
+        return [_copy_tree(value) for value in obj]
+    return obj
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> Dict:
+    """
+    Parse a YAML file, memoized on its path, modification time and size
+
+    Args:
+        path: Path to the YAML file
+        mtime_ns: File modification time, part of the cache key only
+        size: File size in bytes, part of the cache key only
+
+    Returns:
+        Parsed YAML content
+    """
+    # Whole-file bytes let the C scanner skip the stream read-ahead wrapper
+    with open(path, 'rb') as f:
+        return yaml.load(f.read(), Loader=SafeLoader)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_sidecar(path: str, mtime_ns: int, size: int) -> Dict:
+    """
+    Load a parsed config from its JSON sidecar, refreshing it when stale
+
+    The sidecar records the YAML file's size and mtime; it is only trusted
+    when both still match, otherwise the YAML is parsed and the sidecar
+    rewritten atomically. A config JSON cannot reproduce exactly, such as
+    one with non-string keys, gets no sidecar; failing to write the
+    sidecar is not an error.
+
+    Args:
+        path: Path to the YAML configuration file
+        mtime_ns: Configuration file modification time
+        size: Configuration file size in bytes
+
+    Returns:
+        Parsed configuration
+    """
+    config_file = Path(path)
+    cache_file = config_file.with_name(config_file.name + '.cache.json')
+
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('mtime_ns') == mtime_ns and cached.get('size') == size:
+            return cached['config']
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+
+    config = _parse_yaml(path, mtime_ns, size)
+
+    try:
+        payload = json.dumps({'mtime_ns': mtime_ns, 'size': size, 'config': config})
+        # JSON turns non-string keys into strings; only cache exact round trips
+        if json.loads(payload)['config'] != config:
+            return config
+        fd, tmp_path = tempfile.mkstemp(dir=str(config_file.parent), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_file)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, TypeError, ValueError):
+        # Read-only config directory or values JSON cannot represent
+        pass
+
+    return config
+
 
 def load_config(config_path: str) -> Dict:
     """
@@ -21,13 +122,16 @@ def load_config(config_path: str) -> Dict:
         FileNotFoundError: If config file doesn't exist
         yaml.YAMLError: If config file is invalid
     """
-    config_file = Path(config_path)
-
-    if not config_file.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    # Plain string paths keep the cached reload path free of Path objects;
+    # one stat both checks the file exists and keys the parse cache
+    config_file = os.fspath(config_path)
+    try:
+        st = os.stat(config_file)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
 
-    with open(config_file, 'r', encoding='utf-8') as f:
-        config = yaml.safe_load(f)
+    # Callers may modify the returned config, so never hand out the cached object
+    config = _copy_tree(_load_sidecar(config_file, st.st_mtime_ns, st.st_size))
 
     # Validate required keys
     required_keys = ['output', 'scanners', 'providers', 'logging']
@@ -48,12 +152,13 @@ def load_credentials(credentials_path: str = 'config/credentials.yaml') -> Dict:
     Returns:
         Credentials dictionary or empty dict if file doesn't exist
     """
-    cred_file = Path(credentials_path)
-
-    if not cred_file.exists():
+    cred_file = os.fspath(credentials_path)
+    try:
+        st = os.stat(cred_file)
+    except FileNotFoundError:
         return {}
 
-    with open(cred_file, 'r', encoding='utf-8') as f:
-        credentials = yaml.safe_load(f)
+    # Parsed once per file version; callers get their own copy
+    credentials = _parse_yaml(cred_file, st.st_mtime_ns, st.st_size)
 
-    return credentials if credentials else {}
+    return _copy_tree(credentials) if credentials else {}
@@ -7,6 +7,24 @@ import os
 import logging
 from typing import Dict, Optional
 
+# Resolved credential fields exported to the environment, per provider
+_CREDENTIAL_ENV = {
+    'aws': (
+        ('aws_access_key_id', 'AWS_ACCESS_KEY_ID'),
+        ('aws_secret_access_key', 'AWS_SECRET_ACCESS_KEY'),
+        ('aws_session_token', 'AWS_SESSION_TOKEN'),
+        ('profile', 'AWS_PROFILE')
+    ),
+    'azure': (
+        ('tenant_id', 'AZURE_TENANT_ID'),
+        ('client_id', 'AZURE_CLIENT_ID'),
+        ('client_secret', 'AZURE_CLIENT_SECRET')
+    ),
+    'gcp': (
+        ('service_account_key_file', 'GOOGLE_APPLICATION_CREDENTIALS'),
+    )
+}
+
 
 class CredentialManager:
     """Manages credentials for cloud providers"""
@@ -20,6 +38,7 @@ class CredentialManager:
         """
         self.config = credentials_config or {}
         self.logger = logging.getLogger(__name__)
+        self._resolved = {}
 
     def get_aws_credentials(self) -> Dict:
         """
@@ -127,6 +146,20 @@ class CredentialManager:
 
         return credentials
 
+    # Credential resolver for each provider
+    _RESOLVERS = {
+        'aws': get_aws_credentials,
+        'azure': get_azure_credentials,
+        'gcp': get_gcp_credentials
+    }
+
+    def _resolve(self, provider: str) -> Dict:
+        """Resolve a provider's credentials once, reusing them on later calls"""
+        creds = self._resolved.get(provider)
+        if creds is None:
+            creds = self._resolved[provider] = self._RESOLVERS[provider](self)
+        return creds
+
     def setup_environment(self, provider: str):
         """
         Setup environment variables for a specific provider
@@ -134,32 +167,12 @@ class CredentialManager:
         Args:
             provider: Cloud provider name
         """
-        if provider == 'aws':
-            creds = self.get_aws_credentials()
-
-            if 'aws_access_key_id' in creds:
-                os.environ['AWS_ACCESS_KEY_ID'] = creds['aws_access_key_id']
-                os.environ['AWS_SECRET_ACCESS_KEY'] = creds['aws_secret_access_key']
-
-                if 'aws_session_token' in creds:
-                    os.environ['AWS_SESSION_TOKEN'] = creds['aws_session_token']
-
-            if 'profile' in creds:
-                os.environ['AWS_PROFILE'] = creds['profile']
-
-        elif provider == 'azure':
-            creds = self.get_azure_credentials()
+        env_vars = _CREDENTIAL_ENV.get(provider)
+        if env_vars is None:
+            return
 
-            if 'tenant_id' in creds:
-                os.environ['AZURE_TENANT_ID'] = creds['tenant_id']
-                os.environ['AZURE_CLIENT_ID'] = creds['client_id']
-                os.environ['AZURE_CLIENT_SECRET'] = creds['client_secret']
-
-        elif provider == 'gcp':
-            creds = self.get_gcp_credentials()
-
-            if 'service_account_key_file' in creds:
-                os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = creds['service_account_key_file']
+        creds = self._resolve(provider)
+        os.environ.update({name: creds[key] for key, name in env_vars if key in creds})
 
     def validate_credentials(self, provider: str) -> bool:
         """
@@ -172,22 +185,13 @@ class CredentialManager:
             True if credentials are available, False otherwise
         """
         try:
-            if provider == 'aws':
-                self.get_aws_credentials()
-                return True
-
-            elif provider == 'azure':
-                self.get_azure_credentials()
-                return True
-
-            elif provider == 'gcp':
-                self.get_gcp_credentials()
-                return True
-
-            else:
+            if provider not in self._RESOLVERS:
                 self.logger.error(f"Unknown provider: {provider}")
                 return False
 
+            self._resolve(provider)
+            return True
+
         except Exception as e:
             self.logger.error(f"Error validating credentials for {provider}: {str(e)}")
             return False
@@ -2,11 +2,31 @@
 Logging Configuration
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Dict
 
+# Background thread writing queued records to the log file; replaced each
+# time logging is set up
+_file_listener = None
+
+
+def _stop_file_listener():
+    """Flush queued records to the log file and stop the writer thread"""
+    global _file_listener
+    if _file_listener is not None:
+        _file_listener.stop()
+        for handler in _file_listener.handlers:
+            handler.close()
+        _file_listener = None
+
+
+atexit.register(_stop_file_listener)
+
 
 def setup_logging(config: Dict, level: int = logging.INFO):
     """
@@ -29,6 +49,7 @@ def setup_logging(config: Dict, level: int = logging.INFO):
 
     # Clear existing handlers
     logger.handlers.clear()
+    _stop_file_listener()
 
     # Create formatters
     detailed_formatter = logging.Formatter(
@@ -40,13 +61,20 @@ def setup_logging(config: Dict, level: int = logging.INFO):
         '%(levelname)s: %(message)s'
     )
 
-    # File handler
+    # File handler, fed through a queue so logging calls never wait on
+    # disk writes; a listener thread does the writing
     file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(detailed_formatter)
-    logger.addHandler(file_handler)
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    global _file_listener
+    _file_listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _file_listener.start()
 
-    # Console handler (if enabled)
+    # Console handler (if enabled); kept synchronous so log lines stay in
+    # order with the CLI's own output
     if log_config.get('console', True):
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
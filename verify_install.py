@@ -4,25 +4,38 @@ Installation Verification Script
 Checks if all required dependencies are installed correctly
 """
 
+import functools
+import shutil
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from importlib.metadata import version, PackageNotFoundError
 
+# Packages and (command, shell) tools checked by main(), probed concurrently
+# before the results are printed in order
+_PACKAGES = (
+    'prowler', 'boto3', 'botocore', 'azure-identity', 'azure-mgmt-resource',
+    'google-cloud-asset', 'google-cloud-storage', 'click', 'pyyaml', 'jinja2'
+)
+_COMMANDS = (('cloudsploitscan --help', True), ('steampipe', True))
 
-def check_package(package_name, display_name=None):
-    """Check if a package is installed and return its version"""
-    display_name = display_name or package_name
+
+@functools.lru_cache(maxsize=None)
+def _package_version(package_name):
+    """Installed version of a package, or None if it is not installed"""
     try:
-        ver = version(package_name)
-        print(f"✓ {display_name:40s} {ver}")
-        return True
+        return version(package_name)
     except PackageNotFoundError:
-        print(f"✗ {display_name:40s} NOT INSTALLED")
-        return False
+        return None
 
 
-def check_command(command, display_name, shell=False):
-    """Check if a command-line tool is available"""
+@functools.lru_cache(maxsize=None)
+def _probe_command(command, shell=False):
+    """Run a tool once; returns (ok, text to print after its name)"""
+    # A tool missing from PATH is reported without spawning a process
+    if shutil.which(command.split()[0] if shell else command) is None:
+        return False, "NOT FOUND"
+
     try:
         result = subprocess.run(
             command if shell else [command, '--version'],
@@ -34,17 +47,32 @@ def check_command(command, display_name, shell=False):
         if result.returncode == 0:
             # Extract version from output (usually first line)
             output = result.stdout if result.stdout.strip() else result.stderr
-            version_line = output.split('\n')[0].strip() if output else "Installed"
-            print(f"✓ {display_name:40s} {version_line}")
-            return True
+            return True, output.split('\n')[0].strip() if output else "Installed"
         else:
-            print(f"✗ {display_name:40s} NOT WORKING")
-            return False
+            return False, "NOT WORKING"
     except (FileNotFoundError, subprocess.TimeoutExpired) as e:
-        print(f"✗ {display_name:40s} NOT FOUND ({type(e).__name__})")
+        return False, f"NOT FOUND ({type(e).__name__})"
+
+
+def check_package(package_name, display_name=None):
+    """Check if a package is installed and return its version"""
+    display_name = display_name or package_name
+    ver = _package_version(package_name)
+    if ver is not None:
+        print(f"✓ {display_name:40s} {ver}")
+        return True
+    else:
+        print(f"✗ {display_name:40s} NOT INSTALLED")
         return False
 
 
+def check_command(command, display_name, shell=False):
+    """Check if a command-line tool is available"""
+    ok, status = _probe_command(command, shell)
+    print(f"{'✓' if ok else '✗'} {display_name:40s} {status}")
+    return ok
+
+
 def main():
     print("=" * 80)
     print("Cloud Security Scanner - Installation Verification")
@@ -57,6 +85,12 @@ def main():
     print(f"  Python Path: {sys.executable}")
     print()
 
+    # Probe every package and tool at once; tool start-up and metadata
+    # lookups overlap, and the checks below only print the cached results
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        pool.map(_package_version, _PACKAGES)
+        pool.map(lambda args: _probe_command(*args), _COMMANDS)
+
     # Check core security scanners
     print("Core Security Scanners:")
     print("-" * 80)